@@ -8,6 +8,7 @@ from kivymd.uix.behaviors import (
     RectangularElevationBehavior,
     SpecificBackgroundColorBehavior,
 )
+from taptargetview.sequence import TapTargetSequence
 from taptargetview.taptargetview import TapTargetView
 
 example_kv = """
@@ -94,7 +95,6 @@ class TapTargetViewDemo(MDApp):
             title_text="This is an add button",
             description_text="You can cancel it by clicking outside",
             widget_position="left_bottom",
-            end=self.complete,
         )
 
         ttv3 = TapTargetView(
@@ -107,7 +107,6 @@ class TapTargetViewDemo(MDApp):
             description_text="No information available yet!",
             widget_position="center",
             title_position="left_bottom",
-            end=ttv4.start,
         )
 
         ttv2 = TapTargetView(
@@ -118,7 +117,6 @@ class TapTargetViewDemo(MDApp):
             description_text="It won't search anything for now.",
             widget_position="center",
             title_position="left_bottom",
-            end=ttv3.start,
         )
 
         ttv1 = TapTargetView(
@@ -129,9 +127,8 @@ class TapTargetViewDemo(MDApp):
             description_text="Opens up the drawer",
             widget_position="center",
             title_position="right_bottom",
-            end=ttv2.start,
         )
-        ttv1.start()
+        TapTargetSequence(steps=[ttv1, ttv2, ttv3, ttv4], end=self.complete).start()
 
         return self.screen
 
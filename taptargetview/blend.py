@@ -0,0 +1,43 @@
+"""
+Blending callbacks for drawing into an :class:`~kivy.graphics.Fbo` and
+drawing its texture back, to be used as :class:`~kivy.graphics.Callback`
+instructions. Each one is to be followed by :func:`restore_blend`.
+"""
+
+from kivy.graphics.opengl import (
+    GL_ONE,
+    GL_ONE_MINUS_SRC_ALPHA,
+    GL_SRC_ALPHA,
+    GL_ZERO,
+    glBlendFunc,
+    glBlendFuncSeparate,
+)
+
+
+def copy_blend(instruction):
+    """Writes the colors and alpha as they are, without blending."""
+
+    glBlendFunc(GL_ONE, GL_ZERO)
+
+
+def premultiply_blend(instruction):
+    """
+    Blends over a transparent target, leaving it with premultiplied colors
+    and the right alpha.
+    """
+
+    glBlendFuncSeparate(
+        GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_ONE, GL_ONE_MINUS_SRC_ALPHA
+    )
+
+
+def premultiplied_blend(instruction):
+    """Draws a texture which colors are premultiplied by its alpha."""
+
+    glBlendFunc(GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
+
+
+def restore_blend(instruction):
+    """Restores the blending Kivy draws with."""
+
+    glBlendFuncSeparate(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_ONE, GL_ONE)
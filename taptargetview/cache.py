@@ -0,0 +1,273 @@
+"""
+Process-wide caches shared by every
+:class:`~taptargetview.taptargetview.TapTargetView`.
+
+.. rubric:: Usage
+
+    from taptargetview.cache import text_texture_cache
+
+    print(text_texture_cache.stats())
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from math import cos, hypot, pi, sin
+from threading import Thread
+
+from kivy.clock import mainthread
+from kivy.core.text import Label as CoreLabel
+from kivy.core.text.markup import MarkupLabel as CoreMarkupLabel
+from kivy.graphics import Callback, Color, Fbo, Mesh, Rectangle
+from kivy.graphics.texture import Texture
+from kivy.metrics import dp
+
+from taptargetview.blend import copy_blend, restore_blend
+
+
+class LRUCache:
+    """
+    Size-bounded, least recently used cache.
+
+    :param limit: Maximum number of entries kept before the least recently
+        used one gets evicted.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, factory=None):
+        """
+        Returns the entry for `key`, creating it with `factory(*key)` when
+        it is not cached yet. Without `factory`, a missing entry is `None`.
+        """
+
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            if factory is None:
+                return None
+            value = factory(*key)
+            self.put(key, value)
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Stores `value`, evicting the least recently used entries."""
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.limit:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drops every entry. Counters are kept."""
+
+        self._entries.clear()
+
+    def stats(self):
+        """
+        :returns: A dict with the `hits`, `misses` and `evictions` counters,
+            the current `size` and the `limit` of the cache.
+        """
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "limit": self.limit,
+        }
+
+
+def render_text(text, markup, font_size, bold):
+    """
+    Rasterises `text` in white, the color being applied when drawing.
+
+    :returns: The rendered :class:`~kivy.graphics.texture.Texture`.
+    """
+
+    label = (CoreMarkupLabel if markup else CoreLabel)(
+        text=text, font_size=font_size, bold=bold
+    )
+    label.refresh()
+    return label.texture
+
+
+text_texture_cache = LRUCache(limit=64)
+"""
+Text textures keyed by `(text, markup, font_size, bold)`. Views showing the
+same text with the same style share one texture.
+"""
+
+
+def get_text_texture(text, font_size, bold, markup=True):
+    """
+    Returns the cached texture of `text`, or `None` for an empty text.
+    """
+
+    if not text:
+        return None
+    return text_texture_cache.get((text, markup, font_size, bold), render_text)
+
+
+# Space between the title and the description below it.
+DESCRIPTION_SPACING = 5
+
+text_block_cache = LRUCache(limit=32)
+"""
+Title and description rendered together, keyed by their text textures and
+colors, as :class:`~kivy.graphics.Fbo` which texture is drawn by the views.
+"""
+
+
+def render_text_block(title, description, title_color, description_color):
+    """
+    Draws the `title` texture above the `description` one, each in its
+    color, into a single texture.
+
+    :returns: The :class:`~kivy.graphics.Fbo` holding the texture. It
+        redraws it on its own when the GL context is reloaded.
+    """
+
+    width = max(title.width if title else 0, description.width if description else 0)
+    below = description.height + DESCRIPTION_SPACING if description else 0
+    height = below + (title.height if title else 0)
+
+    fbo = Fbo(size=(width, height))
+    with fbo:
+        # The texts don't overlap, so they are copied with their alpha
+        # instead of being blended over the transparent background.
+        Callback(copy_blend)
+        if description:
+            Color(*description_color)
+            Rectangle(texture=description, size=description.size)
+        if title:
+            Color(*title_color)
+            Rectangle(texture=title, pos=(0, below), size=title.size)
+        Callback(restore_blend)
+    fbo.draw()
+    return fbo
+
+
+def get_text_block(title, description, title_color, description_color):
+    """
+    Returns the cached :func:`render_text_block` of the given textures, or
+    `None` when both are `None`.
+    """
+
+    if title is None and description is None:
+        return None
+    return text_block_cache.get(
+        (title, description, tuple(title_color), tuple(description_color)),
+        render_text_block,
+    )
+
+
+CIRCLE_SEGMENTS = 180
+
+
+@lru_cache(maxsize=None)
+def get_circle_mesh(segments=CIRCLE_SEGMENTS):
+    """
+    Tessellates the unit circle, centered on the origin, once per number of
+    `segments`. The returned :class:`~kivy.graphics.Mesh` is shared by every
+    circle of every view, which size and position it with matrix
+    instructions, so its vertices never change.
+    """
+
+    vertices = [0, 0, 0.5, 0.5]
+    for i in range(segments + 1):
+        angle = 2 * pi * i / segments
+        x, y = cos(angle), sin(angle)
+        vertices.extend((x, y, (x + 1) / 2, (y + 1) / 2))
+    return Mesh(
+        vertices=vertices,
+        indices=list(range(segments + 2)),
+        mode="triangle_fan",
+    )
+
+
+SHADOW_BUCKET = dp(32)
+SHADOW_BLUR = dp(16)
+SHADOW_TEXTURE_SIZE = 128
+
+shadow_texture_cache = LRUCache(limit=16)
+"""
+Blurred shadow textures keyed by circle radius bucket, as `(texture, edge)`
+tuples, `edge` being the radius of the circle relative to the one of the
+texture.
+"""
+
+_pending_shadows = {}
+
+
+def render_shadow(edge, size=SHADOW_TEXTURE_SIZE):
+    """
+    Computes the RGBA pixels of the blurred shadow of a circle whose radius
+    is `edge` times the one of the texture.
+    """
+
+    half = size / 2
+    pixels = bytearray(size * size * 4)
+    for y in range(size):
+        for x in range(size):
+            t = (hypot(x + 0.5 - half, y + 0.5 - half) / half - edge) / (1 - edge)
+            if t < 1:
+                alpha = 1 if t <= 0 else (1 - t) ** 2
+                pixels[(y * size + x) * 4 + 3] = int(alpha * 255)
+    return bytes(pixels)
+
+
+def request_shadow_texture(radius, callback):
+    """
+    Calls `callback((texture, edge))` with the shadow of a circle of
+    `radius`. It is called right away when the radius bucket is cached, else
+    on the main thread once a background thread has rendered the pixels.
+    """
+
+    bucket = max(1, round(radius / SHADOW_BUCKET))
+    shadow = shadow_texture_cache.get(bucket)
+    if shadow is not None:
+        callback(shadow)
+    elif bucket in _pending_shadows:
+        _pending_shadows[bucket].append(callback)
+    else:
+        _pending_shadows[bucket] = [callback]
+        edge = bucket * SHADOW_BUCKET / (bucket * SHADOW_BUCKET + SHADOW_BLUR)
+        Thread(target=_render_shadow, args=(bucket, edge), daemon=True).start()
+
+
+def _render_shadow(bucket, edge):
+    _upload_shadow(bucket, edge, render_shadow(edge))
+
+
+@mainthread
+def _upload_shadow(bucket, edge, pixels):
+    def blit(texture):
+        texture.blit_buffer(pixels, colorfmt="rgba", bufferfmt="ubyte")
+
+    texture = Texture.create(
+        size=(SHADOW_TEXTURE_SIZE, SHADOW_TEXTURE_SIZE), colorfmt="rgba"
+    )
+    blit(texture)
+    # Textures created from a buffer are lost with the GL context.
+    texture.add_reload_observer(blit)
+
+    shadow = (texture, edge)
+    shadow_texture_cache.put(bucket, shadow)
+    for callback in _pending_shadows.pop(bucket):
+        callback(shadow)
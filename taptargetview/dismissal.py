@@ -0,0 +1,52 @@
+"""
+Awaitable end of a :class:`~taptargetview.taptargetview.TapTargetView`.
+
+.. rubric:: Usage
+
+    async def onboarding():
+        if await menu_ttv.start() == "target":
+            await search_ttv.start()
+
+The Kivy clock must run on the asyncio loop, as it does with
+:meth:`kivy.app.App.async_run`. Cancelling the awaiting task stops the
+view.
+"""
+
+import asyncio
+
+
+class TapTargetDismissal:
+    """
+    Returned by :meth:`~taptargetview.taptargetview.TapTargetView.start`.
+    Awaiting it returns how the view was dismissed: `'target'`, `'outer'`
+    or `'outside'` for a touch on the target circle, on the outer circle or
+    outside of it, `'stop'` when :meth:`stop` was called.
+    """
+
+    __slots__ = ("view", "reason", "_future")
+
+    def __init__(self, view):
+        self.view = view
+        self.reason = None
+        self._future = None
+        view.fbind("on_dismiss", self._on_dismiss)
+
+    def _on_dismiss(self, view, reason):
+        view.funbind("on_dismiss", self._on_dismiss)
+        self.reason = reason
+        if self._future is not None and not self._future.done():
+            self._future.set_result(self.reason)
+
+    def __await__(self):
+        return self._wait().__await__()
+
+    async def _wait(self):
+        if self.reason is not None:
+            return self.reason
+        if self._future is None:
+            self._future = asyncio.get_running_loop().create_future()
+        try:
+            return await asyncio.shield(self._future)
+        except asyncio.CancelledError:
+            self.view.stop()
+            raise
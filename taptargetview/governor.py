@@ -0,0 +1,164 @@
+"""
+Adaptive quality of every :class:`~taptargetview.taptargetview.TapTargetView`,
+driven by the frame time measured by the Kivy clock.
+
+.. rubric:: Usage
+
+    from taptargetview.governor import governor
+
+    governor.target_fps = 30
+    governor.enabled = True
+    governor.bind(level=lambda governor, level: print(governor.quality))
+
+While a view is showing, the governor steps down one quality level, from the
+circle tessellation and the supersampling of the cached layer to the ripple
+rate, the ripple and the shadow, each time
+the frame budget is missed. Once frames keep fitting in the budget, it steps
+back up, one level at a time. Setting the `TTV_QUALITY_GOVERNOR=1`
+environment variable enables it.
+"""
+
+import os
+from collections import namedtuple
+
+from kivy.clock import Clock
+from kivy.event import EventDispatcher
+from kivy.logger import Logger
+from kivy.properties import BooleanProperty, NumericProperty
+
+from taptargetview.cache import CIRCLE_SEGMENTS
+
+GOVERNOR_ENABLED = os.environ.get("TTV_QUALITY_GOVERNOR") == "1"
+
+Quality = namedtuple(
+    "Quality", ("segments", "supersample", "ripple_fps", "ripple", "shadow")
+)
+"""
+Rendering of the views at one level: segments of the circles, whether the
+layer cached during the ripple may be supersampled, ripple frame rate cap
+(`0` for none), whether the ripple plays and whether the shadow is drawn.
+"""
+
+QUALITY_LEVELS = (
+    Quality(CIRCLE_SEGMENTS, True, 0, True, True),
+    Quality(64, False, 0, True, True),
+    Quality(64, False, 30, True, True),
+    Quality(64, False, 30, False, True),
+    Quality(64, False, 30, False, False),
+)
+
+# Weight of each new frame time in the running average.
+_SMOOTHING = 0.1
+# Frames to measure after a level change before changing it again.
+_SETTLE_FRAMES = 30
+# Frames to fit in the budget before trying the level above.
+_RECOVER_FRAMES = 120
+# Ratios of the frame budget past which a frame time is too long, and
+# within which it fits. The clock sleeps up to the budget when `maxfps` is
+# set, so fitting frames take about the whole budget.
+_MISSED_RATIO = 1.25
+_FITTING_RATIO = 1.05
+
+
+class QualityGovernor(EventDispatcher):
+    """
+    Picks the :data:`QUALITY_LEVELS` every view renders at. Views attach
+    to it while they are showing, frame times are only measured meanwhile.
+    """
+
+    enabled = BooleanProperty(GOVERNOR_ENABLED)
+    """
+    Whether the quality adapts to the frame time. When disabled, the level
+    stays where it is.
+
+    :attr:`enabled` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`, or `True` when the `TTV_QUALITY_GOVERNOR`
+    environment variable is set to `1`.
+    """
+
+    target_fps = NumericProperty(60)
+    """
+    Frame rate whose frame budget the views must fit in.
+
+    :attr:`target_fps` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `60`.
+    """
+
+    level = NumericProperty(0)
+    """
+    Current index in :data:`QUALITY_LEVELS`, `0` being the full quality.
+
+    :attr:`level` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `0`.
+    """
+
+    def __init__(self, **kwargs):
+        self._views = []
+        self._event = None
+        self._average = None
+        self._frames = 0
+        super().__init__(**kwargs)
+
+    @property
+    def quality(self):
+        """The :class:`Quality` of the current :attr:`level`."""
+
+        return QUALITY_LEVELS[self.level]
+
+    def attach(self, view):
+        """Applies the level changes to `view` until it is detached."""
+
+        self._views.append(view)
+        self._update_sampling()
+
+    def detach(self, view):
+        if view in self._views:
+            self._views.remove(view)
+        self._update_sampling()
+
+    def on_enabled(self, instance, value):
+        self._update_sampling()
+
+    def _update_sampling(self):
+        active = self.enabled and self._views
+        if active and self._event is None:
+            self._average = None
+            self._frames = 0
+            self._event = Clock.schedule_interval(self._sample, 0)
+        elif not active and self._event is not None:
+            self._event.cancel()
+            self._event = None
+
+    def _sample(self, dt):
+        if self._average is None:
+            self._average = dt
+        else:
+            self._average += (dt - self._average) * _SMOOTHING
+        self._frames += 1
+
+        budget = 1 / self.target_fps
+        if self._frames < _SETTLE_FRAMES:
+            return
+        if self._average > budget * _MISSED_RATIO:
+            if self.level < len(QUALITY_LEVELS) - 1:
+                self.level += 1
+        elif self._average <= budget * _FITTING_RATIO:
+            if self.level > 0 and self._frames >= _RECOVER_FRAMES:
+                self.level -= 1
+        else:
+            # Neither missing nor fitting: start counting again.
+            self._frames = _SETTLE_FRAMES
+
+    def on_level(self, instance, level):
+        self._frames = 0
+        Logger.info(
+            f"TapTargetView: Quality level {level} {self.quality}, frame time "
+            f"{(self._average or 0) * 1e3:.1f}ms for a "
+            f"{1e3 / self.target_fps:.1f}ms budget"
+        )
+        for view in tuple(self._views):
+            view._apply_quality()
+
+
+governor = QualityGovernor()
+"""The governor of every view."""
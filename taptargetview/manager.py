@@ -0,0 +1,239 @@
+"""
+Shows several :class:`~taptargetview.taptargetview.TapTargetView` at once.
+
+.. rubric:: Usage
+
+    TapTargetManager(
+        views=[menu_ttv, search_ttv, add_ttv],
+        end=my_callback,
+    ).start()
+
+All the ripples run on a single frame tick, and touches are routed through
+one grid index of the target and outer circles instead of every view
+testing every touch.
+"""
+
+from itertools import chain
+from math import ceil, floor, sqrt
+
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.event import EventDispatcher
+from kivy.metrics import dp
+from kivy.properties import ListProperty, NumericProperty, ObjectProperty
+
+# Smallest grid cell, bounding the cells a large circle is inserted in.
+_MIN_CELL_SIZE = dp(16)
+
+
+class _ManagedEvent:
+    """Callback scheduled on the tick of a :class:`TapTargetManager`."""
+
+    __slots__ = ("manager", "callback", "timeout", "elapsed")
+
+    def __init__(self, manager, callback, timeout):
+        self.manager = manager
+        self.callback = callback
+        self.timeout = timeout
+        self.elapsed = 0
+
+    def cancel(self):
+        self.manager._cancel(self)
+
+
+class TapTargetManager(EventDispatcher):
+    """
+    Runs many ``TapTargetView`` simultaneously on one shared frame tick.
+
+    A touch is dispatched to the topmost view whose target circle contains
+    it, else to the topmost view whose outer circle contains it. A touch
+    outside every circle dispatches `on_outside_click` on the cancelable
+    views only.
+
+    A touch only tests the circles of its grid cell above the first one
+    covering the whole cell, whatever the number of views. A touch outside
+    every circle still costs one dispatch per cancelable view.
+    """
+
+    views = ListProperty()
+    """
+    List of :class:`~taptargetview.taptargetview.TapTargetView` to show, the
+    last one being on top.
+
+    :attr:`views` is an :class:`~kivy.properties.ListProperty`
+    and defaults to `[]`.
+    """
+
+    cell_size = NumericProperty(0)
+    """
+    Size of the cells of the grid used to hit test touches, `0` to size them
+    from the radius of the smallest circle.
+
+    :attr:`cell_size` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `0`.
+    """
+
+    end = ObjectProperty()
+    """
+    Function to be called once every view has been dismissed.
+
+    :attr:`end` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
+    def __init__(self, **kwargs):
+        self._active = []
+        self._events = []
+        self._tick_event = None
+        self._index = None
+        super().__init__(**kwargs)
+
+    def start(self, *args):
+        Window.bind(on_touch_down=self._on_touch_down)
+        for view in self.views:
+            view._manager = self
+            view.bind(on_dismiss=self._on_view_dismiss)
+            view.start()
+            view.widget.bind(pos=self._invalidate_index, size=self._invalidate_index)
+            self._active.append(view)
+        self._index = None
+
+    def stop(self, *args):
+        """Dismisses every view still showing."""
+
+        for view in list(self._active):
+            view.stop()
+
+    def schedule_interval(self, callback, timeout):
+        """
+        Same as :meth:`kivy.clock.Clock.schedule_interval`, but `callback`
+        runs on the single tick of the manager, on the first frame once
+        `timeout` seconds have passed.
+        """
+
+        event = _ManagedEvent(self, callback, timeout)
+        self._events.append(event)
+        if self._tick_event is None:
+            self._tick_event = Clock.schedule_interval(self._tick, 0)
+        return event
+
+    def _cancel(self, event):
+        if event in self._events:
+            self._events.remove(event)
+        if not self._events and self._tick_event is not None:
+            self._tick_event.cancel()
+            self._tick_event = None
+
+    def _tick(self, dt):
+        for event in tuple(self._events):
+            event.elapsed += dt
+            if event.elapsed >= event.timeout:
+                event.callback(event.elapsed)
+                event.elapsed = 0
+
+    def _on_view_dismiss(self, view, reason):
+        view.unbind(on_dismiss=self._on_view_dismiss)
+        view.widget.unbind(pos=self._invalidate_index, size=self._invalidate_index)
+        view._manager = None
+        self._active.remove(view)
+        self._index = None
+
+        if not self._active:
+            Window.unbind(on_touch_down=self._on_touch_down)
+            if self.end:
+                self.end(self)
+
+    def _invalidate_index(self, *args):
+        self._index = None
+
+    def _build_index(self):
+        """
+        Inserts every circle in the grid cells of the window it overlaps,
+        the cells being sized from the smallest circle unless
+        :attr:`cell_size` is set. Entries are `(priority, cx, cy, r2, view)`,
+        target circles and upper views having the higher priority. An entry
+        whose circle covers its whole cell has `r2` set to `None`: it contains
+        every touch in that cell, so the entries below it are dropped.
+        """
+
+        circles = []
+        cancelable = []
+        count = len(self._active)
+        for order, view in enumerate(self._active):
+            if view.cancelable:
+                cancelable.append(view)
+            target, outer = view._hit_circles()
+            circles.append((count + order, target, view))
+            circles.append((order, outer, view))
+
+        size = self.cell_size
+        if not size:
+            radii = [r for _, (_, _, r), _ in circles]
+            size = max(min(radii, default=0) / 2, _MIN_CELL_SIZE)
+
+        # Inserted from the topmost circle down, the entries of a cell are
+        # sorted, and a covered cell takes no more of them. Only the cells of
+        # the window are indexed, the rows each column has covered being the
+        # bits of an int.
+        circles.sort(key=lambda circle: circle[0], reverse=True)
+        last_column = int(Window.width // size)
+        last_row = int(Window.height // size)
+        grid = {}
+        covered = [0] * (last_column + 1)
+        whole_column = (1 << last_row + 1) - 1
+        for priority, (cx, cy, r), view in circles:
+            r2 = r * r
+            entry = (priority, cx, cy, r2, view)
+            covering = (priority, cx, cy, None, view)
+            first = max(int((cx - r) // size), 0)
+            for i in range(first, min(int((cx + r) // size), last_column) + 1):
+                mask = covered[i]
+                if mask == whole_column:
+                    continue
+                left, right = i * size, (i + 1) * size
+                near = max(left - cx, 0, cx - right) ** 2
+                far = max(cx - left, right - cx) ** 2
+                if near > r2:
+                    continue
+                # Rows of the column the circle overlaps, then covers.
+                half = sqrt(r2 - near)
+                bottom = max(int((cy - half) // size), 0)
+                top = min(int((cy + half) // size), last_row) + 1
+                if bottom >= top:
+                    continue
+                if far <= r2:
+                    half = sqrt(r2 - far)
+                    full_bottom = min(max(ceil((cy - half) / size), bottom), top)
+                    full_top = max(min(floor((cy + half) / size), top), full_bottom)
+                else:
+                    full_bottom = full_top = top
+                for j in chain(range(bottom, full_bottom), range(full_top, top)):
+                    if not mask >> j & 1:
+                        grid.setdefault((i, j), []).append(entry)
+                rows = ((1 << full_top) - (1 << full_bottom)) & ~mask
+                covered[i] = mask | rows
+                while rows:
+                    j = (rows & -rows).bit_length() - 1
+                    grid.setdefault((i, j), []).append(covering)
+                    rows &= rows - 1
+
+        self._index = (grid, cancelable, count, size)
+        return self._index
+
+    def _on_touch_down(self, window, touch):
+        grid, cancelable, count, size = self._index or self._build_index()
+        x, y = touch.pos
+        cell = (int(x // size), int(y // size))
+
+        for priority, cx, cy, r2, view in grid.get(cell, ()):
+            if r2 is None or (cx - x) ** 2 + (cy - y) ** 2 <= r2:
+                if priority >= count:
+                    view.dispatch("on_target_touch")
+                else:
+                    view.dispatch("on_outer_touch")
+                view._record_touch(touch)
+                return
+
+        for view in cancelable:
+            view.dispatch("on_outside_click")
+            view._record_touch(touch)
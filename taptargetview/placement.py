@@ -0,0 +1,110 @@
+"""
+Placement of the title and description of a
+:class:`~taptargetview.taptargetview.TapTargetView` whose `title_position`
+is `'auto'`.
+
+The text block is tried at a grid of spots over the fully expanded outer
+circle, and the one keeping it inside the circle and the window, clear of
+the target circle and closest to the preferred spot wins. Results are
+memoized, so the solver only runs when the layout of a view changes.
+"""
+
+from math import hypot
+
+from kivy.metrics import dp
+
+from taptargetview.cache import DESCRIPTION_SPACING, LRUCache
+
+# Space kept between the text and the edges it must stay clear of.
+TITLE_MARGIN = dp(12)
+
+# Offsets of the tried text block centers from the outer circle center, as
+# fractions of its diameter.
+_GRID = (-0.3, -0.2, -0.1, 0, 0.1, 0.2, 0.3)
+
+# Weight of the pixels the text overflows by, against the pixels it is away
+# from the preferred spot.
+_OVERFLOW_WEIGHT = 100
+
+placement_cache = LRUCache(limit=256)
+"""Solved title offsets keyed by every argument of :func:`get_title_offset`."""
+
+
+def solve_title_offset(
+    base,
+    circle_offset,
+    diameter,
+    target_diameter,
+    title_size,
+    description_size,
+    window_size,
+    preferred=None,
+):
+    """
+    Finds where to put the title, the description being right below it.
+
+    :param base: Window position of the center of the widget.
+    :param circle_offset: Offset of the outer circle center from `base`, as
+        a fraction of its `diameter`.
+    :param preferred: Title offset to stay closest to, in the same form as
+        the returned one. Defaults to the center of the outer circle.
+    :returns: The offset of the title, as a fraction of `diameter`, in the
+        form of the `_TITLE_POSITION_OFFSETS` of the view.
+    """
+
+    if not diameter:
+        return preferred or (0.5, 0.5)
+
+    bx, by = base
+    cx = bx + diameter * circle_offset[0]
+    cy = by + diameter * circle_offset[1]
+    width = max(title_size[0], description_size[0])
+    below = description_size[1] + DESCRIPTION_SPACING if description_size[1] else 0
+    height = title_size[1] + below
+
+    # Lower left corners of the text block to try.
+    candidates = [
+        (cx + diameter * u - width / 2, cy + diameter * v - height / 2)
+        for u in _GRID
+        for v in _GRID
+    ]
+    if preferred is None:
+        anchor = (cx - width / 2, cy - height / 2)
+    else:
+        anchor = (
+            bx + diameter * (preferred[0] - 0.5),
+            by + diameter * (preferred[1] - 0.5) - below,
+        )
+        candidates.insert(0, anchor)
+
+    radius = diameter / 2 - TITLE_MARGIN
+    target_radius = target_diameter / 2 + TITLE_MARGIN
+    window_width, window_height = window_size
+
+    def cost(corner):
+        x, y = corner
+        right, top = x + width, y + height
+        outside_circle = max(
+            hypot(max(cx - x, right - cx), max(cy - y, top - cy)) - radius, 0
+        )
+        outside_window = (
+            max(-x, 0)
+            + max(right - window_width, 0)
+            + max(-y, 0)
+            + max(top - window_height, 0)
+        )
+        over_target = max(
+            target_radius - hypot(max(x - bx, 0, bx - right), max(y - by, 0, by - top)),
+            0,
+        )
+        overflow = outside_circle + outside_window + over_target
+        return overflow * _OVERFLOW_WEIGHT + hypot(x - anchor[0], y - anchor[1])
+
+    x, y = min(candidates, key=cost)
+    return ((x - bx) / diameter + 0.5, (y + below - by) / diameter + 0.5)
+
+
+def get_title_offset(*args):
+    """Memoized :func:`solve_title_offset`, taking the same arguments."""
+
+    return placement_cache.get(args, solve_title_offset)
@@ -0,0 +1,93 @@
+"""
+Runs several :class:`~taptargetview.taptargetview.TapTargetView` one after
+the other.
+
+.. rubric:: Usage
+
+    TapTargetSequence(
+        steps=[menu_ttv, search_ttv, add_ttv],
+        end=my_callback,
+    ).start()
+
+While a step is showing, the next one gets prepared in the following frames
+so that it starts in the very frame the current one ends.
+"""
+
+from kivy.clock import Clock
+from kivy.event import EventDispatcher
+from kivy.properties import ListProperty, NumericProperty, ObjectProperty
+
+
+class TapTargetSequence(EventDispatcher):
+    """Shows a list of ``TapTargetView`` in order."""
+
+    steps = ListProperty()
+    """
+    Ordered list of :class:`~taptargetview.taptargetview.TapTargetView` to
+    show.
+
+    :attr:`steps` is an :class:`~kivy.properties.ListProperty`
+    and defaults to `[]`.
+    """
+
+    index = NumericProperty(-1)
+    """
+    Index of the step being shown, `-1` when the sequence is not running.
+
+    :attr:`index` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `-1`.
+    """
+
+    end = ObjectProperty()
+    """
+    Function to be called when the last step ends or the sequence is
+    stopped.
+
+    :attr:`end` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
+    def __init__(self, **kwargs):
+        self._prefetch_event = None
+        super().__init__(**kwargs)
+
+    def start(self, *args):
+        self._start_step(0)
+
+    def stop(self, *args):
+        """Dismisses the current step and skips the remaining ones."""
+
+        if self.index < 0:
+            return
+        view = self.steps[self.index]
+        view.unbind(on_dismiss=self._on_step_end)
+        view.stop()
+        # The next step may have been prepared already.
+        if self.index + 1 < len(self.steps):
+            self.steps[self.index + 1].unprepare()
+        self._finish()
+
+    def _start_step(self, index):
+        if index >= len(self.steps):
+            self._finish()
+            return
+
+        self.index = index
+        view = self.steps[index]
+        view.bind(on_dismiss=self._on_step_end)
+        view.start()
+
+        if index + 1 < len(self.steps):
+            self._prefetch_event = Clock.schedule_once(self.steps[index + 1].prepare)
+
+    def _on_step_end(self, view, reason):
+        view.unbind(on_dismiss=self._on_step_end)
+        self._start_step(self.index + 1)
+
+    def _finish(self):
+        if self._prefetch_event:
+            self._prefetch_event.cancel()
+            self._prefetch_event = None
+        self.index = -1
+        if self.end:
+            self.end(self)
@@ -0,0 +1,66 @@
+"""
+Opt-in per-frame instrumentation of
+:class:`~taptargetview.taptargetview.TapTargetView`.
+
+.. rubric:: Usage
+
+    view = TapTargetView(widget=my_button, collect_stats=True)
+    view.bind(on_frame_stats=lambda view, stats: send_to_metrics(stats))
+
+Setting the `TTV_FRAME_STATS=1` environment variable turns it on for every
+view.
+"""
+
+import os
+
+STATS_ENABLED = os.environ.get("TTV_FRAME_STATS") == "1"
+
+# Phases whose samples are frames.
+FRAME_PHASES = ("expand", "ripple", "stop")
+
+
+class FrameStats:
+    """Accumulates the durations spent in each phase of a view."""
+
+    def __init__(self):
+        self.phases = {}
+        self.instructions = 0
+
+    def record(self, phase, duration):
+        """Adds a sample of `duration` seconds to `phase`."""
+
+        stat = self.phases.get(phase)
+        if stat is None:
+            self.phases[phase] = [1, duration, duration]
+        else:
+            stat[0] += 1
+            stat[1] += duration
+            if duration > stat[2]:
+                stat[2] = duration
+
+    def reset(self):
+        """Drops the samples recorded so far, the instruction count stays."""
+
+        self.phases.clear()
+
+    def snapshot(self):
+        """
+        :returns: A plain dict, for each phase, of its sample `count`,
+            `total_ms`, `mean_ms` and `max_ms`, plus the total number of
+            `frames` drawn and the canvas `instructions` of the view.
+        """
+
+        snapshot = {
+            phase: {
+                "count": count,
+                "total_ms": total * 1000,
+                "mean_ms": total / count * 1000,
+                "max_ms": longest * 1000,
+            }
+            for phase, (count, total, longest) in self.phases.items()
+        }
+        snapshot["frames"] = sum(
+            self.phases[phase][0] for phase in FRAME_PHASES if phase in self.phases
+        )
+        snapshot["instructions"] = self.instructions
+        return snapshot
@@ -0,0 +1,102 @@
+"""
+Visual attributes shared by many
+:class:`~taptargetview.taptargetview.TapTargetView`.
+
+.. rubric:: Usage
+
+    DARK = TapTargetStyle(outer_circle_color=(0.1, 0.1, 0.1), draw_shadow=True)
+
+    TapTargetView(widget=menu_btn, style=DARK, title_text="Menu")
+    TapTargetView(widget=add_btn, style=DARK, outer_circle_alpha=0.8)
+
+A view reads every style attribute from its style, unless it has been set
+on the view itself, which only overrides it for that view.
+"""
+
+from kivy.metrics import dp
+
+_DEFAULTS = {
+    "outer_circle_color": (1, 0, 0),
+    "outer_circle_alpha": 0.96,
+    "target_circle_color": (1, 1, 1),
+    "title_text_size": dp(25),
+    "title_text_color": (1, 1, 1, 1),
+    "title_text_bold": True,
+    "description_text_size": dp(20),
+    "description_text_color": (0.9, 0.9, 0.9, 1),
+    "description_text_bold": False,
+    "draw_shadow": False,
+    "ripple_fps": 0,
+    "pause_when_inactive": True,
+    "reduced_motion": False,
+}
+
+
+class TapTargetStyle:
+    """
+    Immutable set of style attributes. Attributes not given are taken from
+    `base`, else from the defaults of
+    :class:`~taptargetview.taptargetview.TapTargetView`.
+    """
+
+    __slots__ = tuple(_DEFAULTS)
+
+    def __init__(self, base=None, **kwargs):
+        for name in self.__slots__:
+            if name in kwargs:
+                value = kwargs.pop(name)
+                if isinstance(value, list):
+                    value = tuple(value)
+            elif base is not None:
+                value = getattr(base, name)
+            else:
+                value = _DEFAULTS[name]
+            object.__setattr__(self, name, value)
+        if kwargs:
+            raise TypeError(f"Unknown style attributes: {', '.join(kwargs)}")
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable, use replace()")
+
+    def __repr__(self):
+        attributes = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__
+        )
+        return f"{type(self).__name__}({attributes})"
+
+    def replace(self, **kwargs):
+        """Returns a copy of the style with the given attributes changed."""
+
+        return TapTargetStyle(self, **kwargs)
+
+
+DEFAULT_STYLE = TapTargetStyle()
+
+
+class StyleAttribute:
+    """
+    Attribute of a view read from its `style`, unless set on the view.
+    Setting it calls the `on_<name>` method of the view, if any, like a
+    Kivy property would.
+    """
+
+    __slots__ = ("name",)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        overrides = view._style_overrides
+        if overrides is not None and self.name in overrides:
+            return overrides[self.name]
+        return getattr(view.style, self.name)
+
+    def __set__(self, view, value):
+        if view._style_overrides is None:
+            view._style_overrides = {}
+        view._style_overrides[self.name] = value
+        handler = getattr(view, "on_" + self.name, None)
+        if handler is not None:
+            handler(view, value)
@@ -8,24 +8,148 @@
 .. rubric:: Attempt to mimic the working of Android's TapTargetView using Kivy and Python..
 """
 
-from kivy.animation import Animation
+from math import ceil, floor
+from time import perf_counter, time
+
+from kivy.clock import Clock
+from kivy.config import Config
+from kivy.core.window import Window
 from kivy.metrics import dp
-from kivy.graphics import Color, Ellipse, Rectangle
+from kivy.graphics import (
+    Callback,
+    Canvas,
+    ClearBuffers,
+    ClearColor,
+    Color,
+    Fbo,
+    InstructionGroup,
+    PopMatrix,
+    PushMatrix,
+    Rectangle,
+    Scale,
+    Translate,
+)
 from kivy.event import EventDispatcher
 from kivy.properties import (
     ObjectProperty,
     NumericProperty,
-    ListProperty,
     StringProperty,
     BooleanProperty,
     OptionProperty,
 )
-from kivy.uix.label import Label
+
+from taptargetview.blend import (
+    premultiplied_blend,
+    premultiply_blend,
+    restore_blend,
+)
+from taptargetview.cache import (
+    DESCRIPTION_SPACING,
+    get_circle_mesh,
+    get_text_block,
+    get_text_texture,
+    request_shadow_texture,
+)
+from taptargetview.dismissal import TapTargetDismissal
+from taptargetview.governor import governor
+from taptargetview.placement import get_title_offset
+from taptargetview.stats import STATS_ENABLED, FrameStats
+from taptargetview.style import DEFAULT_STYLE, StyleAttribute, TapTargetStyle
+from taptargetview.timeline import (
+    get_collapse_timeline,
+    get_expand_timeline,
+    get_ripple_timeline,
+)
+
+# Offsets of the outer circle and of the title from the widget centered
+# outer circle, as fractions of the outer circle's diameter.
+_WIDGET_POSITION_OFFSETS = {
+    "left": ((1 / 3, 0), (1 / 1.4, 1 / 1.4)),
+    "right": ((-1 / 3, 0), (-1 / 10, 1 / 1.4)),
+    "top": ((0, -1 / 3), (1 / 4, 1 / 4)),
+    "bottom": ((0, 1 / 3), (1 / 4, 1 / 1.2)),
+    # Corner ones need to be at a little smaller distance
+    # than edge ones that's why 1/4.
+    "left_top": ((1 / 4, -1 / 4), (1 / 2, 1 / 4)),
+    "right_top": ((-1 / 4, -1 / 4), (-1 / 10, 1 / 4)),
+    "left_bottom": ((1 / 4, 1 / 4), (1 / 2, 1 / 1.2)),
+    "right_bottom": ((-1 / 4, 1 / 4), (0, 1 / 1.2)),
+}
+
+# Vertical offset and opacity of the shadow under the outer circle.
+_SHADOW_OFFSET = dp(4)
+_SHADOW_ALPHA = 0.5
+
+# Fbos are not multisampled: the static layer is rendered at twice the size
+# and filtered down, to keep its edges as smooth as the Window draws them.
+# That is 4 times the texture memory, so only layers of up to
+# _SUPERSAMPLED_PIXELS window pixels are supersampled, a 4 MiB texture at
+# most. Larger ones take 4 bytes per window pixel they cover.
+_STATIC_LAYER_SCALE = 2 if Config.getint("graphics", "multisamples") else 1
+_SUPERSAMPLED_PIXELS = 512 * 512
+
+# Layer of Window.canvas.after every view draws in, above the whole app.
+_overlay_layer = None
+
+# Canvas instructions a started view keeps a reference to.
+_INSTRUCTIONS = (
+    "_shadow_color",
+    "_shadow_rect",
+    "_outer_circle_color",
+    "_outer_circle",
+    "_text_color",
+    "_text_rect",
+    "_target_circle_color",
+    "_target_circle",
+    "_target_ripple_color",
+    "_target_ripple",
+    "_widget_translate",
+    "_static_canvas",
+    "_static_layer",
+)
+
+# Title offsets used when `widget_position` is `'center'`.
+_TITLE_POSITION_OFFSETS = {
+    "left": (1 / 10, 1 / 2),
+    "right": (1 / 1.6, 1 / 2),
+    "top": (1 / 2.5, 1 / 1.3),
+    "bottom": (1 / 2.5, 1 / 4),
+    "left_top": (1 / 8, 1 / 1.4),
+    "right_top": (1 / 2, 1 / 1.3),
+    "left_bottom": (1 / 8, 1 / 4),
+    "right_bottom": (1 / 2, 1 / 3.5),
+}
+
+
+def _get_overlay_layer():
+    global _overlay_layer
+
+    if _overlay_layer is None:
+        _overlay_layer = Canvas()
+        Window.canvas.after.add(_overlay_layer)
+    return _overlay_layer
+
+
+def _check_bindable(names):
+    for name in names:
+        if name in TapTargetStyle.__slots__:
+            raise TypeError(
+                f"'{name}' is a style attribute, not a Kivy property, and cannot "
+                f"be bound: set it on the view or replace the view's style instead"
+            )
 
 
 class TapTargetView(EventDispatcher):
     """Rough try to mimic the working of Android's TapTargetView."""
 
+    __events__ = (
+        "on_outer_touch",
+        "on_target_touch",
+        "on_outside_click",
+        "on_dismiss",
+        "on_frame_stats",
+    )
+
     widget = ObjectProperty()
     """
     Widget to add ``TapTargetView`` upon.
@@ -34,6 +158,16 @@ class TapTargetView(EventDispatcher):
     and defaults to `None`.
     """
 
+    style = ObjectProperty(DEFAULT_STYLE)
+    """
+    :class:`~taptargetview.style.TapTargetStyle` the colors, text sizes and
+    shadow of the view are read from. Views sharing a theme should share
+    one style, setting on a view only the attributes that differ.
+
+    :attr:`style` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to the default `TapTargetStyle()`.
+    """
+
     outer_radius = NumericProperty(dp(300))
     """
     Radius for outer circle.
@@ -42,20 +176,20 @@ class TapTargetView(EventDispatcher):
     and defaults to `dp(300)`.
     """
 
-    outer_circle_color = ListProperty([1, 0, 0])
+    outer_circle_color = StyleAttribute()
     """
     Color for the outer circle.
 
-    :attr:`outer_circle_color` is an :class:`~kivy.properties.ListProperty`
-    and defaults to `[1, 0, 0]`.
+    :attr:`outer_circle_color` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `(1, 0, 0)`.
     """
 
-    outer_circle_alpha = NumericProperty(0.96)
+    outer_circle_alpha = StyleAttribute()
     """
     Alpha value for outer circle.
 
-    :attr:`outer_circle_alpha` is an :class:`~kivy.properties.NumericProperty`
-    and defaults to `0.96`.
+    :attr:`outer_circle_alpha` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `0.96`.
     """
 
     target_radius = NumericProperty(dp(45))
@@ -66,12 +200,12 @@ class TapTargetView(EventDispatcher):
     and defaults to `dp(45)`.
     """
 
-    target_circle_color = ListProperty([1, 1, 1])
+    target_circle_color = StyleAttribute()
     """
     Color for target circle.
 
-    :attr:`target_circle_color` is an :class:`~kivy.properties.ListProperty`
-    and defaults to `[1, 1, 1]`.
+    :attr:`target_circle_color` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `(1, 1, 1)`.
     """
 
     title_text = StringProperty()
@@ -82,28 +216,28 @@ class TapTargetView(EventDispatcher):
     and defaults to `''`.
     """
 
-    title_text_size = NumericProperty(dp(25))
+    title_text_size = StyleAttribute()
     """
     Text size for title.
 
-    :attr:`title_text_size` is an :class:`~kivy.properties.NumericProperty`
-    and defaults to `dp(25)`.
+    :attr:`title_text_size` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `dp(25)`.
     """
 
-    title_text_color = ListProperty([1, 1, 1, 1])
+    title_text_color = StyleAttribute()
     """
     Text color for title.
 
-    :attr:`title_text_color` is an :class:`~kivy.properties.ListProperty`
-    and defaults to `[1, 1, 1, 1]`.
+    :attr:`title_text_color` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `(1, 1, 1, 1)`.
     """
 
-    title_text_bold = BooleanProperty(True)
+    title_text_bold = StyleAttribute()
     """
     Whether title should be bold.
 
-    :attr:`title_text_bold` is an :class:`~kivy.properties.BooleanProperty`
-    and defaults to `True`.
+    :attr:`title_text_bold` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `True`.
     """
 
     description_text = StringProperty()
@@ -114,36 +248,38 @@ class TapTargetView(EventDispatcher):
     and defaults to `''`.
     """
 
-    description_text_size = NumericProperty(dp(20))
+    description_text_size = StyleAttribute()
     """
     Text size for description text.
 
-    :attr:`description_text_size` is an :class:`~kivy.properties.NumericProperty`
-    and defaults to `dp(20)`.
+    :attr:`description_text_size` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `dp(20)`.
     """
 
-    description_text_color = ListProperty([0.9, 0.9, 0.9, 1])
+    description_text_color = StyleAttribute()
     """
     Text size for description text.
 
-    :attr:`description_text_color` is an :class:`~kivy.properties.ListProperty`
-    and defaults to `[0.9, 0.9, 0.9, 1]`.
+    :attr:`description_text_color` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `(0.9, 0.9, 0.9, 1)`.
     """
 
-    description_text_bold = BooleanProperty(False)
+    description_text_bold = StyleAttribute()
     """
     Whether description should be bold.
 
-    :attr:`description_text_bold` is an :class:`~kivy.properties.BooleanProperty`
-    and defaults to `False`.
+    :attr:`description_text_bold` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `False`.
     """
 
-    draw_shadow = BooleanProperty(False)
+    draw_shadow = StyleAttribute()
     """
-    Whether to show shadow.
+    Whether to draw a blurred shadow under the outer circle. Its texture is
+    rendered in the background once per radius bucket and shared by every
+    view.
 
-    :attr:`draw_shadow` is an :class:`~kivy.properties.BooleanProperty`
-    and defaults to `False`.
+    :attr:`draw_shadow` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `False`.
     """
 
     cancelable = BooleanProperty(False)
@@ -193,10 +329,9 @@ class TapTargetView(EventDispatcher):
     )
     """
     Sets the position of :attr`~title_text` on the outer circle. Only works if
-    :attr`~widget_position` is set to `'center'`. In all other cases, it
-    calculates the :attr`~title_position` itself.
-    Must be set to other than `'auto`' when :attr`~widget_position` is set
-    to `'center`'.
+    :attr`~widget_position` is set to `'center'`. With `'auto'`, the title
+    and description are placed inside the outer circle and the window, clear
+    of the target circle, from the size of their textures.
     Available options are `'auto'`, `'left`', `'right`', `'top`', `'bottom`',
     `'left_top`', `'right_top`', `'left_bottom`', `'right_bottom`', `'center`'.
 
@@ -222,213 +357,833 @@ class TapTargetView(EventDispatcher):
 
     end = ObjectProperty()
     """
-    Function to be called when the animation stops.
+    Function to be called when the animation stops, right after the
+    `on_dismiss` event, which receives how the view was dismissed.
 
     :attr:`end` is an :class:`~kivy.properties.ObjectProperty`
     and defaults to `None`.
     """
 
+    collect_stats = BooleanProperty(STATS_ENABLED)
+    """
+    Whether to record per-phase timings (expand, ripple and stop frames, text
+    render, and the touch latency from the input event to the touch being
+    handled), frame counts and canvas instruction count.
+    They are dispatched with the `on_frame_stats` event at the end of each
+    phase and of each ripple cycle, and returned by :meth:`get_frame_stats`.
+
+    :attr:`collect_stats` is an :class:`~kivy.properties.BooleanProperty`
+    and defaults to `False`, or `True` when the `TTV_FRAME_STATS`
+    environment variable is set to `1`.
+    """
+
+    ripple_fps = StyleAttribute()
+    """
+    Maximum number of ripple frames drawn per second, `0` for as many as the
+    app draws.
+
+    :attr:`ripple_fps` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `0`.
+    """
+
+    pause_when_inactive = StyleAttribute()
+    """
+    Whether the ripple pauses while the window is minimized, hidden or
+    unfocused.
+
+    :attr:`pause_when_inactive` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `True`.
+    """
+
+    reduced_motion = StyleAttribute()
+    """
+    Whether to show the view without motion: the circles appear and vanish
+    at once, and a still halo around the target circle takes the place of
+    the ripple, so nothing is drawn while the view waits for a touch.
+
+    :attr:`reduced_motion` is a style attribute, read from
+    :attr:`style` unless set on the view, and defaults to `False`.
+    """
+
+    frames_requested = 0
+    """
+    Number of frames the view has drawn, each of them making the window draw
+    again, since it was created.
+    """
+
     def __init__(self, **kwargs):
         self.ripple_max_dist = dp(90)
+        self.ripple_duration = 1
+        self._timeline = None
+        self._timeline_event = None
+        self._timeline_apply = None
+        self._timeline_end = None
+        self._timeline_time = 0
+        self._collapse_from = None
+        # Animated diameters of the circles and alpha of the ripple.
+        self._outer_size = self._target_size = 0
+        self._ripple_size = self._ripple_alpha = 0
+        self._dirty_texts = set()
+        self._static_dirty = True
+        self._static_layer = None
+        self._refresh_trigger = None
+        self._window_hidden = False
+        self._layout = None
+        self._prepared = False
+        self._stats = None
+        self._phase = None
+        self._manager = None
+        self._shadow = None
+        self._shadow_rect = None
+        self._canvas = None
+        self._dismiss_reason = None
+        self._style_overrides = None
         self.outer_radius *= 2
         self.target_radius *= 2
 
-        self.core_title_text = Label(
-            markup=True, size_hint=(None, None), bold=self.title_text_bold
-        )
-        self.core_title_text.bind(texture_size=self.core_title_text.setter("size"))
-        self.core_description_text = Label(markup=True, size_hint=(None, None))
-        self.core_description_text.bind(
-            texture_size=self.core_description_text.setter("size")
-        )
+        self._title_texture = None
+        self._description_texture = None
+        self._text_block = None
+
+        # Style attributes are not Kivy properties.
+        for name in TapTargetStyle.__slots__:
+            if name in kwargs:
+                setattr(self, name, kwargs.pop(name))
 
         super().__init__(**kwargs)
-        self.register_event_type("on_outer_touch")
-        self.register_event_type("on_target_touch")
-        self.register_event_type("on_outside_click")
+        self.on_collect_stats(self, self.collect_stats)
+        self.bind(
+            widget_position=self._invalidate_layout,
+            title_position=self._invalidate_layout,
+            outer_radius=self._invalidate_layout,
+        )
+
+    def bind(self, **kwargs):
+        _check_bindable(kwargs)
+        return super().bind(**kwargs)
+
+    def fbind(self, name, func, *args, **kwargs):
+        _check_bindable((name,))
+        return super().fbind(name, func, *args, **kwargs)
 
     def _initialize(self):
-        setattr(self.widget, "outer_radius", 0)
-        setattr(self.widget, "target_radius", 0)
-        setattr(self.widget, "target_ripple_radius", 0)
-        setattr(self.widget, "target_ripple_alpha", 0)
+        self._outer_size = self._target_size = 0
+        self._ripple_size = self._ripple_alpha = 0
 
         # Bind some function on widget event when this function is called
         # instead of when the class itself is initialized to prevent all
         # widgets of all instances to get bind at once and start messing up.
-        self.widget.bind(on_touch_down=self._some_func)
+        # Views run by a TapTargetManager get their touches from it.
+        if self._manager is None:
+            self.widget.bind(on_touch_down=self._some_func)
+        self.prepare()
 
-    def _draw_canvas(self):
-        _pos = self._ttv_pos()
-        self.widget.canvas.before.clear()
+    def prepare(self, *args):
+        """
+        Renders the texts and resolves the layout of the view ahead of
+        :meth:`start`, which otherwise does it itself. Nothing is rendered
+        nor bound when the view is created, so views that are never shown
+        cost next to nothing.
+        :class:`~taptargetview.sequence.TapTargetSequence` calls it for the
+        next step while the current one is animating.
+        """
 
-        with self.widget.canvas.before:
+        if self._prepared:
+            return
+        self._prepared = True
+        self.widget.bind(pos=self._invalidate_layout, size=self._invalidate_layout)
+        Window.bind(
+            size=self._invalidate_layout,
+            on_draw=self._check_widget_moved,
+            focus=self._update_ripple_pause,
+            on_minimize=self._on_window_hide,
+            on_hide=self._on_window_hide,
+            on_restore=self._on_window_show,
+            on_show=self._on_window_show,
+        )
+        self._update_title_texture()
+        self._update_description_texture()
+        self._update_text_block()
+        self._dirty_texts.clear()
+        self._compute_layout()
+        if self.draw_shadow:
+            request_shadow_texture(self.outer_radius / 2, self._set_shadow)
+
+    def unprepare(self, *args):
+        """
+        Undoes :meth:`prepare` on a view that is not showing: unbinds it
+        and drops its text textures. Stopped views are unprepared once
+        dismissed.
+        """
+
+        if not self._prepared or self._canvas is not None:
+            return
+        self._prepared = False
+        self.widget.unbind(pos=self._invalidate_layout, size=self._invalidate_layout)
+        Window.unbind(
+            size=self._invalidate_layout,
+            on_draw=self._check_widget_moved,
+            focus=self._update_ripple_pause,
+            on_minimize=self._on_window_hide,
+            on_hide=self._on_window_hide,
+            on_restore=self._on_window_show,
+            on_show=self._on_window_show,
+        )
+        if self._refresh_trigger is not None:
+            self._refresh_trigger.cancel()
+        self._dirty_texts.clear()
+        self._title_texture = self._description_texture = None
+        self._text_block = None
+        self._layout = None
+
+    def _set_shadow(self, shadow):
+        self._shadow = shadow
+        if self._shadow_rect is not None:
+            self._shadow_rect.texture = shadow[0]
+            self._shadow_color.a = _SHADOW_ALPHA
+            self._invalidate_static()
+
+    def _update_shadow(self):
+        """
+        Follows :attr:`draw_shadow` once the view is prepared: requests the
+        shadow texture, and adds or drops the shadow of a showing view.
+        """
+
+        if not self._prepared:
+            return
+        if self._canvas is not None and self.draw_shadow != (
+            self._shadow_rect is not None
+        ):
+            if self.draw_shadow:
+                self._add_shadow()
+            else:
+                self._static_canvas.before.clear()
+                self._shadow_color = self._shadow_rect = None
+            self._invalidate_static()
+        if self.draw_shadow:
+            request_shadow_texture(self.outer_radius / 2, self._set_shadow)
+
+    def _add_shadow(self):
+        """
+        Adds the shadow under the outer circle, transparent until its
+        texture is ready.
+        """
+
+        with self._static_canvas.before:
+            self._shadow_color = Color(0, 0, 0, 0)
+            self._shadow_rect = Rectangle(size=(0, 0))
+        if self._shadow:
+            self._set_shadow(self._shadow)
+
+    def _build_canvas(self):
+        """
+        Creates the instructions of the view once. Every frame after that
+        only updates them in :meth:`_draw_canvas`.
+        """
+
+        # The view draws in its own canvas on a Window level layer, leaving
+        # the canvas of the widget untouched. Views started later are on top.
+        self._canvas = Canvas()
+        self._static_layer = None
+        _get_overlay_layer().add(self._canvas)
+
+        # What stays still during the ripple, cached into a texture then.
+        self._static_canvas = Canvas()
+        self._canvas.add(self._static_canvas)
+
+        with self._static_canvas:
             # Outer circle.
-            Color(*self.outer_circle_color, self.outer_circle_alpha, group="ttv_group")
-            _rad1 = self.widget.outer_radius
-            Ellipse(size=(_rad1, _rad1), pos=_pos[0], group="ttv_group")
-
-            # Title text.
-            Color(*self.title_text_color, group="ttv_group")
-            Rectangle(
-                size=self.core_title_text.texture.size,
-                texture=self.core_title_text.texture,
-                pos=_pos[1],
-                group="ttv_group",
-            )
+            self._outer_circle_color = Color()
+            self._outer_circle = self._add_circle(self._static_canvas)
 
-            # Description text.
-            Color(*self.description_text_color, group="ttv_group")
-            Rectangle(
-                size=self.core_description_text.texture.size,
-                texture=self.core_description_text.texture,
-                pos=(_pos[1][0], _pos[1][1] - self.core_description_text.size[1] - 5),
-                group="ttv_group",
-            )
+            # Title and description, in a single texture.
+            self._text_color = Color()
+            self._text_rect = Rectangle(size=(0, 0))
 
             # Target circle.
-            Color(*self.target_circle_color, group="ttv_group")
-            _rad2 = self.widget.target_radius
-            Ellipse(
-                size=(_rad2, _rad2),
-                pos=(
-                    self.widget.x - (_rad2 / 2 - self.widget.size[0] / 2),
-                    self.widget.y - (_rad2 / 2 - self.widget.size[0] / 2),
-                ),
-                group="ttv_group",
-            )
+            self._target_circle_color = Color()
+            self._target_circle = self._add_circle(self._static_canvas)
 
+        # Shadow, below the outer circle.
+        self._shadow_rect = None
+        if self.draw_shadow:
+            self._add_shadow()
+
+        with self._canvas:
             # Target ripple.
-            Color(
-                *self.target_circle_color,
-                self.widget.target_ripple_alpha,
-                group="ttv_group",
+            self._target_ripple_color = Color()
+            self._target_ripple = self._add_circle(self._canvas)
+
+            # The widget itself, above its target circle, drawn live from
+            # its own canvas moved to its window position. Adding the canvas
+            # would take it from its parent, it is drawn once more instead.
+            Color()
+            PushMatrix()
+            self._widget_translate = Translate()
+            widget_canvas = self.widget.canvas
+            Callback(lambda instruction: widget_canvas.draw())
+            PopMatrix()
+
+        if self._stats is not None:
+            self._stats.instructions = (
+                len(self._static_canvas.children) + len(self._canvas.children) - 1
             )
-            _rad3 = self.widget.target_ripple_radius
-            Ellipse(
-                size=(_rad3, _rad3),
-                pos=(
-                    self.widget.x - (_rad3 / 2 - self.widget.size[0] / 2),
-                    self.widget.y - (_rad3 / 2 - self.widget.size[0] / 2),
-                ),
-                group="ttv_group",
+
+    def _draw_canvas(self):
+        _pos = self._ttv_pos()
+
+        # Outer circle.
+        self._outer_circle_color.rgba = (
+            *self.outer_circle_color,
+            self.outer_circle_alpha,
+        )
+        _rad1 = self._outer_size
+        self._update_circle(
+            self._outer_circle, _pos[0][0] + _rad1 / 2, _pos[0][1] + _rad1 / 2, _rad1
+        )
+
+        # Shadow.
+        if self._shadow_rect is not None and self._shadow:
+            _size = _rad1 / self._shadow[1] if governor.quality.shadow else 0
+            self._shadow_rect.size = (_size, _size)
+            self._shadow_rect.pos = (
+                _pos[0][0] + (_rad1 - _size) / 2,
+                _pos[0][1] + (_rad1 - _size) / 2 - _SHADOW_OFFSET,
             )
 
+        # Texts, hidden as soon as the view stops. The title is at the top
+        # of their texture, the description below it.
+        self._text_color.a = 0 if self._phase == "stop" else 1
+        texture = self._text_block.texture if self._text_block else None
+        if self._text_rect.texture is not texture:
+            self._text_rect.texture = texture
+            self._text_rect.size = texture.size if texture else (0, 0)
+        self._text_rect.pos = (
+            _pos[1][0],
+            _pos[1][1] - self._description_text_height(),
+        )
+
+        # Target circle.
+        self._target_circle_color.rgb = self.target_circle_color
+        _center_x, _center_y = self._layout[0]
+        self._update_circle(
+            self._target_circle, _center_x, _center_y, self._target_size
+        )
+
+        # Target ripple.
+        self._target_ripple_color.rgba = (
+            *self.target_circle_color,
+            self._ripple_alpha,
+        )
+        self._update_circle(
+            self._target_ripple,
+            _center_x,
+            _center_y,
+            self._ripple_size,
+        )
+
+        # Widget, from its parent coordinates to the window ones.
+        self._widget_translate.xy = (
+            _center_x - self.widget.size[0] / 2 - self.widget.x,
+            _center_y - self.widget.size[0] / 2 - self.widget.y,
+        )
+        self._static_dirty = False
+
+    def _draw_ripple(self):
+        """
+        Only updates the ripple, everything else being the same as in the
+        previous frame.
+        """
+
+        self._target_ripple_color.a = self._ripple_alpha
+        _center_x, _center_y = self._layout[0]
+        self._update_circle(
+            self._target_ripple,
+            _center_x,
+            _center_y,
+            self._ripple_size,
+        )
+
+    def _cache_static_layer(self):
+        """
+        Renders the shadow, the outer circle, the texts and the target
+        circle into an :class:`~kivy.graphics.Fbo`, drawn in their place
+        while the ripple plays. The Fbo renders again by itself whenever one
+        of them changes, and is replaced once they cover another area.
+        """
+
+        bounds = self._get_static_bounds()
+        if bounds == self._get_static_layer_bounds():
+            return
+        self._uncache_static_layer()
+        if bounds is None:
+            return
+
+        x, y, width, height = bounds
+        self._canvas.remove(self._static_canvas)
+        scale = 1
+        if governor.quality.supersample and width * height <= _SUPERSAMPLED_PIXELS:
+            scale = _STATIC_LAYER_SCALE
+        fbo = Fbo(size=(width * scale, height * scale))
+        with fbo:
+            ClearColor(0, 0, 0, 0)
+            ClearBuffers()
+            Callback(premultiply_blend)
+            PushMatrix()
+            Scale(scale, scale, 1)
+            Translate(-x, -y)
+        fbo.add(self._static_canvas)
+        with fbo:
+            PopMatrix()
+            Callback(restore_blend)
+
+        layer = InstructionGroup()
+        layer.add(fbo)
+        layer.add(Callback(premultiplied_blend))
+        layer.add(Color(1, 1, 1, 1))
+        layer.add(Rectangle(texture=fbo.texture, pos=(x, y), size=(width, height)))
+        layer.add(Callback(restore_blend))
+        self._canvas.insert(0, layer)
+        self._static_layer = layer
+
+    def _uncache_static_layer(self):
+        """Draws the static part of the view directly again."""
+
+        layer = self._static_layer
+        if layer is None:
+            return
+        layer.children[0].remove(self._static_canvas)
+        self._canvas.remove(layer)
+        self._canvas.insert(0, self._static_canvas)
+        self._static_layer = None
+
+    def _get_static_layer_bounds(self):
+        """:returns: The bounds the static layer was cached with, if it is."""
+
+        if self._static_layer is None:
+            return None
+        rect = self._static_layer.children[-2]
+        return (*rect.pos, *rect.size)
+
+    def _get_static_bounds(self):
+        """
+        :returns: The window pixels covered by the static part of the view,
+            as `(x, y, width, height)`, or `None` when there are none.
+        """
+
+        boxes = []
+        for translate, scale in (self._outer_circle, self._target_circle):
+            (x, y), radius = translate.xy, scale.x
+            boxes.append((x - radius, y - radius, x + radius, y + radius))
+        for rect in (self._shadow_rect, self._text_rect):
+            if rect is not None and rect.size[0] and rect.size[1]:
+                (x, y), (width, height) = rect.pos, rect.size
+                boxes.append((x, y, x + width, y + height))
+
+        left = max(floor(min(box[0] for box in boxes)), 0)
+        bottom = max(floor(min(box[1] for box in boxes)), 0)
+        right = min(ceil(max(box[2] for box in boxes)), Window.width)
+        top = min(ceil(max(box[3] for box in boxes)), Window.height)
+        if right <= left or top <= bottom:
+            return None
+        return left, bottom, right - left, top - bottom
+
+    def _add_circle(self, canvas):
+        """
+        Adds to `canvas` a circle drawn from the shared unit circle mesh,
+        sized and positioned by its matrix instructions only.
+
+        :returns: The `Translate` and `Scale` instructions of the circle.
+        """
+
+        PushMatrix()
+        translate = Translate()
+        scale = Scale()
+        canvas.add(get_circle_mesh(governor.quality.segments))
+        PopMatrix()
+        return translate, scale
+
+    def _set_circle_segments(self, segments):
+        """Swaps the mesh of every circle for the one with `segments`."""
+
+        mesh = get_circle_mesh(segments)
+        for canvas, circle in (
+            (self._static_canvas, self._outer_circle),
+            (self._static_canvas, self._target_circle),
+            (self._canvas, self._target_ripple),
+        ):
+            # The mesh of a circle is right after its Scale.
+            index = canvas.indexof(circle[1]) + 1
+            previous = canvas.children[index]
+            if previous is not mesh:
+                canvas.remove(previous)
+                canvas.insert(index, mesh)
+
+    def _apply_quality(self):
+        """Renders the view at the current level of the governor."""
+
+        self._set_circle_segments(governor.quality.segments)
+        # Cached again, at the scale of the level.
+        self._uncache_static_layer()
+        self._invalidate_static()
+        self._restart_ripple()
+
+    def _update_circle(self, circle, x, y, diameter):
+        translate, scale = circle
+        translate.xy = (x, y)
+        scale.xyz = (diameter / 2, diameter / 2, 1)
+
+    def _description_text_height(self):
+        # Height of the text block below the bottom of the title.
+        texture = self._description_texture
+        return texture.height + DESCRIPTION_SPACING if texture else 0
+
     def stop(self, *args):
-        # It needs a better implementation.
-        self.anim_ripple.unbind(on_complete=self._repeat_ripple)
-        self.description_text_color = [1, 1, 1, 0]
-        self.title_text_color = [1, 1, 1, 0]
-        anim = Animation(
-            d=0.15,
-            t="in_cubic",
-            **dict(
-                zip(
-                    ["outer_radius", "target_radius", "target_ripple_radius"], [0, 0, 0]
-                )
-            ),
+        if self._canvas is None or self._phase == "stop":
+            return
+
+        if self._dismiss_reason is None:
+            self._dismiss_reason = "stop"
+        self._phase = "stop"
+        self._uncache_static_layer()
+        # The circles shrink from wherever the expand or the ripple is.
+        self._collapse_from = (
+            self._outer_size,
+            self._target_size,
+            self._ripple_size,
         )
-        anim.bind(on_complete=self._after_stop)
-        anim.start(self.widget)
+        self._play(get_collapse_timeline(), self._apply_collapse, self._after_stop)
 
     def _after_stop(self, *args):
-        self.widget.canvas.before.remove_group("ttv_group")
-        args[0].stop_all(self.widget)
-        elev = getattr(self.widget, "elevation", None)
-
-        if elev:
-            self._fix_elev()
-        if self.end:
-            self.end(self)
+        governor.detach(self)
+        _get_overlay_layer().remove(self._canvas)
+        self._canvas = None
+        # The instructions hold the canvas of the widget.
+        for name in _INSTRUCTIONS:
+            setattr(self, name, None)
 
         # Don't forget to unbind the function or it'll mess
         # up with other next bindings.
         self.widget.unbind(on_touch_down=self._some_func)
+        self._timeline = self._collapse_from = None
+        self.unprepare()
+        self._dispatch_stats()
 
-    def _fix_elev(self):
-        with self.widget.canvas.before:
-            Color(a=self.widget._soft_shadow_a)
-            Rectangle(
-                texture=self.widget._soft_shadow_texture,
-                size=self.widget._soft_shadow_size,
-                pos=self.widget._soft_shadow_pos,
-            )
-            Color(a=self.widget._hard_shadow_a)
-            Rectangle(
-                texture=self.widget._hard_shadow_texture,
-                size=self.widget._hard_shadow_size,
-                pos=self.widget._hard_shadow_pos,
-            )
-
-            Color(a=1)
+        # The view may be started again from `end`, resetting the reason.
+        self.dispatch("on_dismiss", self._dismiss_reason)
+        if self.end:
+            self.end(self)
 
     def start(self, *args):
+        """
+        Shows the view. Does nothing while it is showing or collapsing.
+
+        :returns: A :class:`~taptargetview.dismissal.TapTargetDismissal`,
+            which can be awaited for the view to be dismissed.
+        """
+
+        dismissal = TapTargetDismissal(self)
+        if self._canvas is not None:
+            return dismissal
+        self._dismiss_reason = None
         self._initialize()
+        self._build_canvas()
+        governor.attach(self)
         self._animate_outer()
+        return dismissal
 
     def _animate_outer(self):
-        anim = Animation(
-            d=0.2,
-            t="out_cubic",
-            **dict(
-                zip(
-                    ["outer_radius", "target_radius"],
-                    [self.outer_radius, self.target_radius],
-                )
-            ),
+        self._phase = "expand"
+        self._ripple_size = self.target_radius
+        self._ripple_alpha = 1
+        self._play(
+            get_expand_timeline(self.outer_radius, self.target_radius),
+            self._apply_expand,
+            self._animate_ripple,
         )
-        anim.cancel_all(self.widget)
-        anim.bind(on_progress=lambda x, y, z: self._draw_canvas())
-        anim.bind(on_complete=self._animate_ripple)
-        anim.start(self.widget)
-        setattr(self.widget, "target_ripple_radius", self.target_radius)
-        setattr(self.widget, "target_ripple_alpha", 1)
-
-    def _animate_ripple(self, *args):
-        self.anim_ripple = Animation(
-            d=1,
-            t="in_cubic",
-            target_ripple_radius=self.target_radius + self.ripple_max_dist,
-            target_ripple_alpha=0,
+
+    def _animate_ripple(self):
+        """
+        Starts the endless ripple, a baked cycle played in a loop, or shows
+        it frozen halfway with :attr:`reduced_motion`. The ripple is hidden
+        when the governor turns it off.
+        """
+
+        self._dispatch_stats()
+        self._phase = "ripple"
+        self._cache_static_layer()
+        timeline = get_ripple_timeline(
+            self.target_radius, self.ripple_max_dist, self.ripple_duration
         )
-        self.anim_ripple.stop_all(self.widget)
-        self.anim_ripple.bind(on_progress=lambda x, y, z: self._draw_canvas())
-        self.anim_ripple.bind(on_complete=self._repeat_ripple)
-        self.anim_ripple.start(self.widget)
+        if self.reduced_motion:
+            self._stop_timeline()
+            self._apply_ripple(*timeline.sample(timeline.duration / 2))
+            self._draw_frame()
+        elif not governor.quality.ripple:
+            self._stop_timeline()
+            self._apply_ripple(self.target_radius, 0)
+            self._draw_frame()
+        else:
+            self._play(timeline, self._apply_ripple)
+
+    def _play(self, timeline, apply, on_end=None):
+        """
+        Plays a baked `timeline` on a single clock event, calling `apply`
+        with the values of each frame, then `on_end`. Without `on_end`, the
+        timeline loops until another one is played.
+        """
+
+        self._stop_timeline()
+        self._timeline = timeline
+        self._timeline_apply = apply
+        self._timeline_end = on_end
+        # Without motion, the first frame is the last one.
+        self._timeline_time = timeline.duration if self.reduced_motion else 0
+        self._schedule_timeline()
+
+    def _schedule_timeline(self):
+        interval = 0
+        if self._timeline_end is None:
+            if self._is_inactive():
+                return
+            fps = self.ripple_fps
+            cap = governor.quality.ripple_fps
+            if cap and not 0 < fps <= cap:
+                fps = cap
+            if fps > 0:
+                interval = 1 / fps
+        clock = self._manager or Clock
+        self._timeline_event = clock.schedule_interval(self._update_timeline, interval)
+
+    def _update_timeline(self, dt):
+        timeline = self._timeline
+        self._timeline_time += dt
+        if self._timeline_time >= timeline.duration:
+            if self._timeline_end is not None:
+                self._timeline_apply(*timeline.sample(timeline.duration))
+                self._draw_frame()
+                on_end = self._timeline_end
+                self._stop_timeline()
+                on_end()
+                return
+            self._timeline_time %= timeline.duration
+            self._dispatch_stats()
+        self._timeline_apply(*timeline.sample(self._timeline_time))
+        self._draw_frame()
+
+    def _stop_timeline(self):
+        self._pause_timeline()
+        self._timeline_apply = self._timeline_end = None
+
+    def _pause_timeline(self):
+        if self._timeline_event:
+            self._timeline_event.cancel()
+            self._timeline_event = None
+
+    def _is_inactive(self):
+        return self.pause_when_inactive and (self._window_hidden or not Window.focus)
+
+    def _update_ripple_pause(self, *args):
+        """Pauses or resumes the looping ripple as the window comes and goes."""
+
+        if self._phase != "ripple" or self._timeline_apply is None:
+            return
+        if self._is_inactive():
+            self._pause_timeline()
+        elif self._timeline_event is None:
+            self._schedule_timeline()
+
+    def _on_window_hide(self, *args):
+        self._window_hidden = True
+        self._update_ripple_pause()
+
+    def _on_window_show(self, *args):
+        self._window_hidden = False
+        self._update_ripple_pause()
+
+    def _restart_ripple(self, *args):
+        if self._phase == "ripple":
+            self._animate_ripple()
+
+    on_ripple_fps = on_pause_when_inactive = on_reduced_motion = _restart_ripple
+
+    def _apply_expand(self, outer_radius, target_radius):
+        self._outer_size = outer_radius
+        self._target_size = target_radius
+
+    def _apply_ripple(self, radius, alpha):
+        self._ripple_size = radius
+        self._ripple_alpha = alpha
+
+    def _apply_collapse(self, factor):
+        outer_radius, target_radius, ripple_radius = self._collapse_from
+        self._outer_size = outer_radius * factor
+        self._target_size = target_radius * factor
+        self._ripple_size = ripple_radius * factor
+
+    def _draw_frame(self):
+        self.frames_requested += 1
+        start = perf_counter()
+        # During the ripple, the rest of the view only needs to be drawn
+        # again once the layout, a text or a color changes.
+        if self._phase != "ripple":
+            self._draw_canvas()
+        elif self._static_dirty:
+            self._draw_canvas()
+            self._cache_static_layer()
+        else:
+            self._draw_ripple()
+        self._record_stats(self._phase, start)
+
+    def _record_stats(self, phase, start):
+        if self._stats is not None:
+            self._stats.record(phase, perf_counter() - start)
+
+    def _record_touch(self, touch):
+        # Touches are stamped with time() by the input provider, the latency
+        # runs from there to the touch being handled.
+        if self._stats is not None:
+            self._stats.record("touch", time() - touch.time_start)
+
+    def _dispatch_stats(self):
+        if self._stats is not None:
+            self.dispatch("on_frame_stats", self._stats.snapshot())
+
+    def get_frame_stats(self):
+        """
+        :returns: A snapshot dict of the statistics recorded so far, empty
+            when :attr:`collect_stats` is `False`.
+        """
+
+        if self._stats is None:
+            return {}
+        return self._stats.snapshot()
+
+    def reset_frame_stats(self):
+        """
+        Drops the statistics recorded so far, so that the next snapshots
+        only cover what follows.
+        """
+
+        if self._stats is not None:
+            self._stats.reset()
+
+    def _update_title_texture(self, *args):
+        start = perf_counter()
+        self._title_texture = get_text_texture(
+            self.title_text, self.title_text_size, self.title_text_bold
+        )
+        self._record_stats("text", start)
+
+    def _update_description_texture(self, *args):
+        start = perf_counter()
+        self._description_texture = get_text_texture(
+            self.description_text,
+            self.description_text_size,
+            self.description_text_bold,
+        )
+        self._record_stats("text", start)
+
+    def _update_text_block(self):
+        start = perf_counter()
+        self._text_block = get_text_block(
+            self._title_texture,
+            self._description_texture,
+            self.title_text_color,
+            self.description_text_color,
+        )
+        self._record_stats("text", start)
+
+    def on_collect_stats(self, instance, value):
+        if not value:
+            self._stats = None
+        elif self._stats is None:
+            self._stats = FrameStats()
 
-    def _repeat_ripple(self, *args):
-        setattr(self.widget, "target_ripple_radius", self.target_radius)
-        setattr(self.widget, "target_ripple_alpha", 1)
-        self._animate_ripple()
+    def on_style(self, instance, value):
+        self._static_dirty = True
+        self._invalidate_texts("title", "description")
+        self._update_shadow()
+        self._restart_ripple()
+
+    def on_draw_shadow(self, instance, value):
+        self._update_shadow()
 
     def on_description_text(self, instance, value):
-        self.core_description_text.text = value
+        self._invalidate_texts("description")
 
     def on_description_text_size(self, instance, value):
-        self.core_description_text.font_size = value
+        self._invalidate_texts("description")
 
     def on_description_text_bold(self, instance, value):
-        self.core_description_text.bold = value
+        self._invalidate_texts("description")
 
     def on_title_text(self, instance, value):
-        self.core_title_text.text = value
+        self._invalidate_texts("title")
 
     def on_title_text_size(self, instance, value):
-        self.core_title_text.font_size = value
+        self._invalidate_texts("title")
 
     def on_title_text_bold(self, instance, value):
-        self.core_title_text.bold = value
+        self._invalidate_texts("title")
+
+    def _invalidate_texts(self, *names):
+        """
+        Schedules a re-render of the `names` texts and of the texture
+        combining them for the next frame, so that any number of changes
+        within a frame render each text once.
+        """
+
+        if not self._prepared:
+            return
+        self._dirty_texts.update(names + ("block",))
+        self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        if self._refresh_trigger is None:
+            self._refresh_trigger = Clock.create_trigger(self._refresh)
+        self._refresh_trigger()
+
+    def _refresh(self, *args):
+        """
+        Renders the changed texts, then draws the view if no running
+        timeline draws it in its own frame.
+        """
+
+        dirty = self._dirty_texts
+        if dirty:
+            if "title" in dirty:
+                self._update_title_texture()
+            if "description" in dirty:
+                self._update_description_texture()
+            self._update_text_block()
+            dirty.clear()
+            self._layout = None
+            self._static_dirty = True
+        if self._canvas is not None and self._timeline_event is None:
+            self._draw_frame()
+
+    def on_dismiss(self, reason):
+        pass
+
+    def on_frame_stats(self, stats):
+        pass
 
     def on_target_touch(self):
         if self.stop_on_target_touch:
-            self.stop()
+            self._stop_by("target")
 
     def on_outer_touch(self):
         if self.stop_on_outer_touch:
-            self.stop()
+            self._stop_by("outer")
 
     def on_outside_click(self):
         if self.cancelable:
+            self._stop_by("outside")
+
+    def _stop_by(self, reason):
+        if self._canvas is not None and self._phase != "stop":
+            self._dismiss_reason = reason
             self.stop()
 
     def _some_func(self, wid, touch):
@@ -437,16 +1192,32 @@ class TapTargetView(EventDispatcher):
         position.
         """
 
-        if self._check_pos_target(touch.pos):
+        pos = self.widget.to_window(*touch.pos)
+        if self._check_pos_target(pos):
             self.dispatch("on_target_touch")
-        elif self._check_pos_outer(touch.pos):
+        elif self._check_pos_outer(pos):
             self.dispatch("on_outer_touch")
         else:
             self.dispatch("on_outside_click")
+        self._record_touch(touch)
+
+    def _hit_circles(self):
+        """
+        :returns: The center and radius of the target circle and of the fully
+            expanded outer circle, as two `(x, y, r)` tuples.
+        """
+
+        (x, y), (cx, cy), _ = self._layout or self._compute_layout()
+        _rad1 = self.outer_radius
+        return (
+            (*self.widget.to_window(*self.widget.center), self.target_radius / 2),
+            (x + _rad1 * (cx + 0.5), y + _rad1 * (cy + 0.5), _rad1 / 2),
+        )
 
     def _check_pos_outer(self, pos):
         """
-        Checks if a given `pos` coordinate is within the :attr:`~outer_radius`.
+        Checks if a given `pos` coordinate, in Window coordinates, is within
+        the :attr:`~outer_radius`.
         """
 
         cx = self.circ_pos[0] + self.outer_radius / 2
@@ -455,28 +1226,103 @@ class TapTargetView(EventDispatcher):
         h, k = pos
 
         lhs = (cx - h) ** 2 + (cy - k) ** 2
-        rhs = r ** 2
+        rhs = r**2
         if lhs <= rhs:
             return True
         return False
 
     def _check_pos_target(self, pos):
         """
-        Checks if a given `pos` coordinate is within the
-        :attr:`~target_radius`.
+        Checks if a given `pos` coordinate, in Window coordinates, is within
+        the :attr:`~target_radius`.
         """
 
-        cx = self.widget.pos[0] + self.widget.width / 2
-        cy = self.widget.pos[1] + self.widget.height / 2
+        cx, cy = self.widget.to_window(*self.widget.center)
         r = self.target_radius / 2
         h, k = pos
 
         lhs = (cx - h) ** 2 + (cy - k) ** 2
-        rhs = r ** 2
+        rhs = r**2
         if lhs <= rhs:
             return True
         return False
 
+    def _text_size(self, texture):
+        return tuple(texture.size) if texture else (0, 0)
+
+    def _invalidate_layout(self, *args):
+        self._layout = None
+        if self._manager is not None:
+            self._manager._invalidate_index()
+        self._invalidate_static()
+
+    def _check_widget_moved(self, *args):
+        """
+        Invalidates the layout once the widget moved on the window without
+        its own `pos` changing, its parents being moved, scrolled or
+        transformed. Called when the window is drawn.
+        """
+
+        if self._layout is None:
+            return
+        x, y = self.widget.to_window(*self.widget.pos)
+        half = self.widget.size[0] / 2
+        if self._layout[0] != (x + half, y + half):
+            self._invalidate_layout()
+
+    def _invalidate_static(self, *args):
+        self._static_dirty = True
+        if self._canvas is not None and self._timeline_event is None:
+            self._schedule_refresh()
+
+    on_outer_circle_color = on_outer_circle_alpha = _invalidate_static
+    on_target_circle_color = _invalidate_static
+
+    def on_title_text_color(self, instance, value):
+        self._invalidate_texts()
+
+    def on_description_text_color(self, instance, value):
+        self._invalidate_texts()
+
+    def _compute_layout(self):
+        """
+        Resolves the position options into a base point and per-diameter
+        coefficients for the outer circle and the title. It only runs when
+        the widget geometry or one of the options changes.
+        """
+
+        if self.widget_position == "center":
+            circ_offset = (0, 0)
+            title_offset = _TITLE_POSITION_OFFSETS.get(self.title_position)
+            if title_offset is None and self.title_position != "auto":
+                raise ValueError(
+                    f"'{self.title_position}'"
+                    f"is not a valid value for title_position"
+                )
+        else:
+            circ_offset, title_offset = _WIDGET_POSITION_OFFSETS[self.widget_position]
+
+        # The overlay is drawn in Window coordinates.
+        x, y = self.widget.to_window(*self.widget.pos)
+        base = (x + self.widget.size[0] / 2, y + self.widget.size[0] / 2)
+        if self.title_position == "auto":
+            title_offset = get_title_offset(
+                base,
+                circ_offset,
+                self.outer_radius,
+                self.target_radius,
+                self._text_size(self._title_texture),
+                self._text_size(self._description_texture),
+                tuple(Window.size),
+                title_offset,
+            )
+        self._layout = (
+            base,
+            (circ_offset[0] - 0.5, circ_offset[1] - 0.5),
+            (title_offset[0] - 0.5, title_offset[1] - 0.5),
+        )
+        return self._layout
+
     def _ttv_pos(self):
         """
         Calculates the `pos` value for outer circle and text
@@ -485,65 +1331,11 @@ class TapTargetView(EventDispatcher):
         :returns: A tuple containing pos for the circle and text.
         """
 
-        _rad1 = self.widget.outer_radius
-        _center_x = self.widget.x - (_rad1 / 2 - self.widget.size[0] / 2)
-        _center_y = self.widget.y - (_rad1 / 2 - self.widget.size[0] / 2)
-
-        if self.widget_position == "left":
-            circ_pos = (_center_x + _rad1 / 3, _center_y)
-            title_pos = (_center_x + _rad1 / 1.4, _center_y + _rad1 / 1.4)
-        elif self.widget_position == "right":
-            circ_pos = (_center_x - _rad1 / 3, _center_y)
-            title_pos = (_center_x - _rad1 / 10, _center_y + _rad1 / 1.4)
-        elif self.widget_position == "top":
-            circ_pos = (_center_x, _center_y - _rad1 / 3)
-            title_pos = (_center_x + _rad1 / 4, _center_y + _rad1 / 4)
-        elif self.widget_position == "bottom":
-            circ_pos = (_center_x, _center_y + _rad1 / 3)
-            title_pos = (_center_x + _rad1 / 4, _center_y + _rad1 / 1.2)
-        # Corner ones need to be at a little smaller distance
-        # than edge ones that's why _rad1/4.
-        elif self.widget_position == "left_top":
-            circ_pos = (_center_x + _rad1 / 4, _center_y - _rad1 / 4)
-            title_pos = (_center_x + _rad1 / 2, _center_y + _rad1 / 4)
-        elif self.widget_position == "right_top":
-            circ_pos = (_center_x - _rad1 / 4, _center_y - _rad1 / 4)
-            title_pos = (_center_x - _rad1 / 10, _center_y + _rad1 / 4)
-        elif self.widget_position == "left_bottom":
-            circ_pos = (_center_x + _rad1 / 4, _center_y + _rad1 / 4)
-            title_pos = (_center_x + _rad1 / 2, _center_y + _rad1 / 1.2)
-        elif self.widget_position == "right_bottom":
-            circ_pos = (_center_x - _rad1 / 4, _center_y + _rad1 / 4)
-            title_pos = (_center_x, _center_y + _rad1 / 1.2)
-        else:
-            # Center.
-            circ_pos = (_center_x, _center_y)
+        (x, y), (cx, cy), (tx, ty) = self._layout or self._compute_layout()
+        _rad1 = self._outer_size
 
-            if self.title_position == "auto":
-                raise ValueError(
-                    "widget_position='center' requires title_position to be set."
-                )
-            elif self.title_position == "left":
-                title_pos = (_center_x + _rad1 / 10, _center_y + _rad1 / 2)
-            elif self.title_position == "right":
-                title_pos = (_center_x + _rad1 / 1.6, _center_y + _rad1 / 2)
-            elif self.title_position == "top":
-                title_pos = (_center_x + _rad1 / 2.5, _center_y + _rad1 / 1.3)
-            elif self.title_position == "bottom":
-                title_pos = (_center_x + _rad1 / 2.5, _center_y + _rad1 / 4)
-            elif self.title_position == "left_top":
-                title_pos = (_center_x + _rad1 / 8, _center_y + _rad1 / 1.4)
-            elif self.title_position == "right_top":
-                title_pos = (_center_x + _rad1 / 2, _center_y + _rad1 / 1.3)
-            elif self.title_position == "left_bottom":
-                title_pos = (_center_x + _rad1 / 8, _center_y + _rad1 / 4)
-            elif self.title_position == "right_bottom":
-                title_pos = (_center_x + _rad1 / 2, _center_y + _rad1 / 3.5)
-            else:
-                raise ValueError(
-                    f"'{self.title_position}'"
-                    f"is not a valid value for title_position"
-                )
+        circ_pos = (x + _rad1 * cx, y + _rad1 * cy)
+        title_pos = (x + _rad1 * tx, y + _rad1 * ty)
 
         self.circ_pos = circ_pos
         return circ_pos, title_pos
@@ -0,0 +1,119 @@
+"""
+Animation timelines of :class:`~taptargetview.taptargetview.TapTargetView`,
+baked into keyframe tables.
+
+Each timeline is sampled once per set of parameters and shared by every
+view animating with the same radii, so a frame only looks its values up.
+"""
+
+from array import array
+from math import ceil
+
+from kivy.animation import AnimationTransition
+
+from taptargetview.cache import LRUCache
+
+# Keyframes per second of animation. Values in between are interpolated.
+TIMELINE_RATE = 240
+
+EXPAND_DURATION = 0.2
+COLLAPSE_DURATION = 0.15
+
+
+class Timeline:
+    """
+    Keyframes of one or more channels, evenly spaced over `duration`
+    seconds, each channel being an `array` of doubles.
+    """
+
+    __slots__ = ("duration", "channels", "_last", "_rate")
+
+    def __init__(self, duration, channels):
+        self.duration = duration
+        self.channels = channels
+        self._last = len(channels[0]) - 1
+        self._rate = self._last / duration
+
+    @classmethod
+    def bake(cls, duration, curves):
+        """
+        Samples `curves`, functions of the progress from `0` to `1`
+        returning the value of each channel.
+        """
+
+        count = ceil(duration * TIMELINE_RATE)
+        return cls(
+            duration,
+            tuple(
+                array("d", (curve(i / count) for i in range(count + 1)))
+                for curve in curves
+            ),
+        )
+
+    def sample(self, time):
+        """
+        :returns: The list of the values of every channel at `time`,
+            interpolated between the two nearest keyframes.
+        """
+
+        position = time * self._rate
+        if position >= self._last:
+            last = self._last
+            return [channel[last] for channel in self.channels]
+        index = int(position)
+        fraction = position - index
+        return [
+            channel[index] + (channel[index + 1] - channel[index]) * fraction
+            for channel in self.channels
+        ]
+
+
+timeline_cache = LRUCache(limit=64)
+"""Baked timelines keyed by their kind and parameters."""
+
+
+def _bake_expand(kind, outer_radius, target_radius):
+    out_cubic = AnimationTransition.out_cubic
+    return Timeline.bake(
+        EXPAND_DURATION,
+        (
+            lambda p: outer_radius * out_cubic(p),
+            lambda p: target_radius * out_cubic(p),
+        ),
+    )
+
+
+def _bake_ripple(kind, target_radius, max_dist, duration):
+    in_cubic = AnimationTransition.in_cubic
+    return Timeline.bake(
+        duration,
+        (
+            lambda p: target_radius + max_dist * in_cubic(p),
+            lambda p: 1 - in_cubic(p),
+        ),
+    )
+
+
+def _bake_collapse(kind):
+    in_cubic = AnimationTransition.in_cubic
+    return Timeline.bake(COLLAPSE_DURATION, (lambda p: 1 - in_cubic(p),))
+
+
+def get_expand_timeline(outer_radius, target_radius):
+    """Outer and target circle diameters growing from `0`, `out_cubic`."""
+
+    return timeline_cache.get(("expand", outer_radius, target_radius), _bake_expand)
+
+
+def get_ripple_timeline(target_radius, max_dist, duration):
+    """Ripple diameter and alpha over one ripple cycle, `in_cubic`."""
+
+    return timeline_cache.get(
+        ("ripple", target_radius, max_dist, duration), _bake_ripple
+    )
+
+
+def get_collapse_timeline():
+    """Factor shrinking the circles to `0` when the view stops, `in_cubic`."""
+
+    return timeline_cache.get(("collapse",), _bake_collapse)
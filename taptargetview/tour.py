@@ -0,0 +1,210 @@
+"""
+Runs onboarding tours defined in JSON files.
+
+.. rubric:: Usage
+
+    TapTargetTour(
+        source="tours/onboarding.json",
+        ids=root.ids,
+        styles={"dark": DARK_STYLE},
+        end=my_callback,
+    ).start()
+
+The file holds one array of step objects. `widget` is the id of the target
+widget in :attr:`TapTargetTour.ids`, `style` the name of a style in
+:attr:`TapTargetTour.styles`, and every other key is passed as is to
+:class:`~taptargetview.taptargetview.TapTargetView`::
+
+    [
+        {"widget": "menu_btn", "title_text": "Menu", "style": "dark",
+         "widget_position": "center", "title_position": "right_bottom"},
+        {"widget": "add_btn", "title_text": "Add",
+         "outer_circle_color": [0, 0.5, 1]}
+    ]
+
+Steps are parsed one at a time while the tour runs, each view being
+created when the previous step starts and released once it ends, so memory
+use does not depend on the length of the tour.
+"""
+
+import json
+
+from kivy.clock import Clock
+from kivy.event import EventDispatcher
+from kivy.properties import (
+    DictProperty,
+    NumericProperty,
+    ObjectProperty,
+    StringProperty,
+)
+
+from taptargetview.taptargetview import TapTargetView
+
+_WHITESPACE = " \t\r\n"
+
+
+def iter_tour_steps(path, chunk_size=4096):
+    """
+    Parses the JSON array of step objects in the file at `path` lazily,
+    reading it by chunks of `chunk_size` characters.
+
+    :returns: A generator of the step dicts.
+    """
+
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        opened = False
+        while True:
+            separators = _WHITESPACE + "," if opened else _WHITESPACE
+            while pos < len(buffer) and buffer[pos] in separators:
+                pos += 1
+            if pos == len(buffer):
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise ValueError(f"{path}: unexpected end of the tour")
+                buffer, pos = chunk, 0
+                continue
+
+            if not opened:
+                if buffer[pos] != "[":
+                    raise ValueError(f"{path}: a tour must be a JSON array")
+                opened = True
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                return
+
+            try:
+                step, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The step is cut by the end of the buffer.
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+            if not isinstance(step, dict):
+                raise ValueError(f"{path}: tour steps must be JSON objects")
+            buffer, pos = buffer[end:], 0
+            yield step
+
+
+class TapTargetTour(EventDispatcher):
+    """Shows the steps of a JSON tour definition in order."""
+
+    source = StringProperty()
+    """
+    Path of the JSON file defining the tour.
+
+    :attr:`source` is an :class:`~kivy.properties.StringProperty`
+    and defaults to `''`.
+    """
+
+    ids = ObjectProperty()
+    """
+    Mapping of the widget ids used by the steps to the widgets, such as the
+    `ids` of a kv root widget.
+
+    :attr:`ids` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
+    styles = DictProperty()
+    """
+    :class:`~taptargetview.style.TapTargetStyle` the steps can refer to by
+    name.
+
+    :attr:`styles` is an :class:`~kivy.properties.DictProperty`
+    and defaults to `{}`.
+    """
+
+    index = NumericProperty(-1)
+    """
+    Index of the step being shown, `-1` when the tour is not running.
+
+    :attr:`index` is an :class:`~kivy.properties.NumericProperty`
+    and defaults to `-1`.
+    """
+
+    end = ObjectProperty()
+    """
+    Function to be called when the last step ends or the tour is stopped.
+
+    :attr:`end` is an :class:`~kivy.properties.ObjectProperty`
+    and defaults to `None`.
+    """
+
+    def __init__(self, **kwargs):
+        self._steps = None
+        self._view = None
+        self._next_view = None
+        self._prefetch_event = None
+        super().__init__(**kwargs)
+
+    def start(self, *args):
+        self._steps = iter_tour_steps(self.source)
+        self._start_step(self._make_view())
+
+    def stop(self, *args):
+        """Dismisses the current step and skips the remaining ones."""
+
+        if self._view is None:
+            return
+        self._view.unbind(on_dismiss=self._on_step_end)
+        self._view.stop()
+        self._finish()
+
+    def _make_view(self):
+        step = next(self._steps, None)
+        if step is None:
+            return None
+
+        widget_id = step.pop("widget", None)
+        try:
+            widget = self.ids[widget_id]
+        except (KeyError, TypeError):
+            raise ValueError(f"'{widget_id}' is not a widget id of the tour")
+        if "style" in step:
+            step["style"] = self.styles[step["style"]]
+        return TapTargetView(widget=widget, **step)
+
+    def _start_step(self, view):
+        if view is None:
+            self._finish()
+            return
+
+        self.index += 1
+        self._view = view
+        self._next_view = None
+        view.bind(on_dismiss=self._on_step_end)
+        view.start()
+        self._prefetch_event = Clock.schedule_once(self._prefetch)
+
+    def _prefetch(self, *args):
+        self._prefetch_event = None
+        self._next_view = self._make_view()
+        if self._next_view is not None:
+            self._next_view.prepare()
+
+    def _on_step_end(self, view, reason):
+        view.unbind(on_dismiss=self._on_step_end)
+        if self._prefetch_event is not None:
+            self._prefetch_event.cancel()
+            self._prefetch()
+        self._view = None
+        self._start_step(self._next_view)
+
+    def _finish(self):
+        if self._prefetch_event is not None:
+            self._prefetch_event.cancel()
+            self._prefetch_event = None
+        if self._steps is not None:
+            self._steps.close()
+            self._steps = None
+        self._view = None
+        self._next_view = None
+        self.index = -1
+        if self.end:
+            self.end(self)
@@ -0,0 +1,73 @@
+"""
+Runs the tests headless: offscreen SDL2 window when no display is available
+and no frame rate cap, so :meth:`kivy.clock.Clock.tick` never sleeps.
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault("KIVY_NO_ARGS", "1")
+os.environ.setdefault("KIVY_NO_FILELOG", "1")
+if not os.environ.get("DISPLAY"):
+    os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from kivy.config import Config  # noqa: E402
+
+Config.set("graphics", "maxfps", "0")
+
+import pytest  # noqa: E402
+from kivy.clock import Clock  # noqa: E402
+from kivy.core.window import Window  # noqa: E402,F401
+from kivy.uix.widget import Widget  # noqa: E402
+
+from taptargetview.taptargetview import TapTargetView  # noqa: E402
+
+
+def tick_until(predicate, timeout=5):
+    """Ticks the clock until `predicate()` is true, returns the frame count."""
+
+    frames = 0
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("condition not reached in time")
+        Clock.tick()
+        frames += 1
+    return frames
+
+
+def tick_for(seconds):
+    """Ticks the clock for `seconds`, returns the frame count."""
+
+    deadline = time.perf_counter() + seconds
+    return tick_until(lambda: time.perf_counter() >= deadline, seconds + 5)
+
+
+def is_rippling(view):
+    return view._phase == "ripple"
+
+
+@pytest.fixture
+def make_view():
+    """
+    Returns a factory of started-ready views, each on its own widget.
+    Views still running at the end of the test get stopped.
+    """
+
+    views = []
+
+    def factory(pos=(100, 100), size=(48, 48), **kwargs):
+        kwargs.setdefault("title_text", "Title")
+        kwargs.setdefault("description_text", "Description")
+        view = TapTargetView(widget=Widget(pos=pos, size=size), **kwargs)
+        views.append(view)
+        return view
+
+    yield factory
+
+    for view in views:
+        view.stop()
+    tick_until(lambda: not any(view._canvas for view in views))
@@ -0,0 +1,295 @@
+"""
+Benchmarks of the render and touch paths of ``TapTargetView``.
+
+Every measurement is compared to ``benchmark_baselines.json`` and fails once
+it regresses past the baseline by more than ``TTV_BENCH_TOLERANCE`` (a ratio,
+defaults to `0.5`). Noisy CI runners can loosen it, `1` allowing twice the
+baseline. Instruction counts must not grow at all.
+Timings (``_us`` and ``_ms`` results) depend on the machine and its load, they
+are only checked with ``TTV_BENCH=1``, on the machine the baselines come from.
+Run with ``TTV_BENCH_UPDATE=1`` to store the current results as baselines.
+"""
+
+import json
+import os
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+import pytest
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.graphics.opengl import glFinish
+from kivy.uix.widget import Widget
+
+from conftest import is_rippling, tick_for, tick_until
+from taptargetview.manager import TapTargetManager
+from taptargetview.style import TapTargetStyle
+from taptargetview.taptargetview import TapTargetView
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "benchmark_baselines.json")
+TOLERANCE = float(os.environ.get("TTV_BENCH_TOLERANCE", 0.5))
+CHECK_TIMINGS = os.environ.get("TTV_BENCH") == "1"
+UPDATE = os.environ.get("TTV_BENCH_UPDATE") == "1"
+REPEAT = 5
+
+results = {}
+
+
+def _load_baselines():
+    try:
+        with open(BASELINES_PATH) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+baselines = _load_baselines()
+
+
+def report(name, value, exact=False):
+    """
+    Records a measurement and checks it against its stored baseline, timings
+    only with ``TTV_BENCH=1``. `exact` measurements, such as instruction
+    counts, may not grow at all.
+    """
+
+    results[name] = value
+    if UPDATE or name not in baselines:
+        return
+    if name.endswith(("_us", "_ms")) and not CHECK_TIMINGS:
+        return
+    limit = baselines[name] if exact else baselines[name] * (1 + TOLERANCE)
+    assert value <= limit, f"{name} regressed: {value} > {baselines[name]}"
+
+
+def time_per_call(func, calls):
+    """Best time of `REPEAT` runs after a warm-up one, in microseconds per call."""
+
+    for _ in range(calls):
+        func()
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return round(best / calls * 1e6, 3)
+
+
+def _walk(canvas):
+    for instruction in canvas.children:
+        yield instruction
+        if hasattr(instruction, "children"):
+            yield from _walk(instruction)
+
+
+def canvas_instructions(*widgets):
+    """Returns every instruction drawn by `widgets` and the Window."""
+
+    instructions = set()
+    for obj in (*widgets, Window):
+        canvas = obj.canvas
+        for layer in (canvas.before, canvas, canvas.after):
+            instructions.update(_walk(layer))
+    return instructions
+
+
+def run_frames(views, seconds):
+    """
+    Ticks the clock for `seconds`, returns the time per frame in
+    microseconds and the number of instructions allocated per frame.
+    """
+
+    widgets = [view.widget for view in views]
+    previous = canvas_instructions(*widgets)
+    allocated = frames = elapsed = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        Clock.tick()
+        elapsed += time.perf_counter() - start
+        frames += 1
+        current = canvas_instructions(*widgets)
+        allocated += len(current - previous)
+        previous = current
+    return round(elapsed / frames * 1e6, 3), allocated / frames
+
+
+@pytest.fixture(scope="module", autouse=True)
+def store_results():
+    yield
+    print("\nTapTargetView benchmarks:")
+    for name, value in sorted(results.items()):
+        baseline = baselines.get(name)
+        print(f"  {name:<40} {value:>12} (baseline {baseline})")
+    if UPDATE:
+        with open(BASELINES_PATH, "w") as f:
+            json.dump(dict(sorted(results.items())), f, indent=4)
+            f.write("\n")
+
+
+def test_draw_canvas(make_view):
+    view = make_view()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    report("draw_canvas_us", time_per_call(view._draw_canvas, 2000))
+
+    previous = canvas_instructions(view.widget)
+    view._draw_canvas()
+    report(
+        "draw_canvas_instructions_allocated",
+        len(canvas_instructions(view.widget) - previous),
+        exact=True,
+    )
+
+
+def test_ripple_frame(make_view):
+    view = make_view()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    report("ripple_frame_us", time_per_call(view._draw_frame, 2000))
+
+
+def render_frame():
+    """Ticks the clock and renders the Window, waiting for the GL to finish."""
+
+    Clock.tick()
+    Window.dispatch("on_draw")
+    glFinish()
+
+
+@pytest.mark.parametrize("shadow", [False, True])
+def test_ripple_render_frame(make_view, shadow):
+    view = make_view(pos=(300, 250), draw_shadow=shadow)
+    view.start()
+    tick_until(lambda: is_rippling(view) and (view._shadow or not shadow))
+    render_frame()
+    name = "ripple_render_shadow_frame_us" if shadow else "ripple_render_frame_us"
+    report(name, time_per_call(render_frame, 20))
+
+
+def test_draw_canvas_with_shadow(make_view):
+    view = make_view(draw_shadow=True)
+    view.start()
+    tick_until(lambda: is_rippling(view) and view._shadow)
+    report("draw_canvas_shadow_us", time_per_call(view._draw_canvas, 2000))
+
+
+def test_ttv_pos(make_view):
+    view = make_view(widget_position="center", title_position="left_bottom")
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    report("ttv_pos_us", time_per_call(view._ttv_pos, 5000))
+
+
+def test_check_pos(make_view):
+    view = make_view()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    points = [(x * 37 % 800, y * 53 % 600) for x in range(20) for y in range(5)]
+
+    def check_all():
+        for pos in points:
+            view._check_pos_target(pos)
+            view._check_pos_outer(pos)
+
+    report("check_pos_us", round(time_per_call(check_all, 50) / len(points), 3))
+
+
+def test_start_stop_cycle(make_view):
+    view = make_view()
+    dismissed = []
+    view.bind(on_dismiss=lambda view, reason: dismissed.append(reason))
+
+    start = time.perf_counter()
+    view.start()
+    frames = tick_until(lambda: is_rippling(view))
+    frames += tick_for(0.5)
+    view.stop()
+    frames += tick_until(lambda: dismissed)
+    report("cycle_frame_us", round((time.perf_counter() - start) / frames * 1e6, 3))
+
+    tracemalloc.start()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    view.stop()
+    tick_until(lambda: len(dismissed) == 2)
+    report("cycle_peak_kib", round(tracemalloc.get_traced_memory()[1] / 1024, 1))
+    tracemalloc.stop()
+
+
+@pytest.mark.parametrize("count", [1, 10, 50, 200])
+def test_concurrent_views(make_view, count):
+    views = [
+        make_view(pos=(i * 7 % 700, i * 13 % 500), widget_position="left")
+        for i in range(count)
+    ]
+
+    tracemalloc.start()
+    for view in views:
+        view.start()
+    tick_until(lambda: all(is_rippling(view) for view in views))
+    tick_for(0.1)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    frame_us, allocated = run_frames(views, 0.3)
+
+    report(f"concurrent_{count}_frame_us", frame_us)
+    report(f"concurrent_{count}_instructions_allocated", allocated, exact=True)
+    report(f"concurrent_{count}_peak_kib", round(peak / 1024, 1))
+
+
+@pytest.mark.parametrize("count", [10, 200])
+def test_manager_touch_dispatch(make_view, count):
+    views = [
+        make_view(pos=(i * 7 % 700, i * 13 % 500), stop_on_target_touch=False)
+        for i in range(count)
+    ]
+    manager = TapTargetManager(views=views)
+    manager.start()
+    tick_until(lambda: all(is_rippling(view) for view in views))
+    touches = [
+        SimpleNamespace(pos=(x * 37 % 800, y * 53 % 600), time_start=time.time())
+        for x in range(20)
+        for y in range(5)
+    ]
+    manager._build_index()
+
+    def dispatch_all():
+        for touch in touches:
+            manager._on_touch_down(Window, touch)
+
+    report(
+        f"manager_touch_{count}_us",
+        round(time_per_call(dispatch_all, 20) / len(touches), 3),
+    )
+    manager.stop()
+
+
+def test_construct_1000_views():
+    styles = [
+        TapTargetStyle(outer_circle_color=(0, 0, 1), description_text_size=18),
+        TapTargetStyle(outer_circle_alpha=0.9, target_circle_color=(0, 0, 0)),
+        TapTargetStyle(title_text_bold=False, draw_shadow=True),
+    ]
+    widgets = [Widget() for _ in range(1000)]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    views = [
+        TapTargetView(
+            widget=widget,
+            style=styles[i % 3],
+            title_text="Title",
+            description_text="Description",
+        )
+        for i, widget in enumerate(widgets)
+    ]
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    assert len(views) == 1000
+    report("construct_1000_views_ms", round(elapsed * 1e3, 3))
+    report("construct_1000_views_kib", round(size / 1024, 1))
@@ -0,0 +1,77 @@
+import asyncio
+
+from kivy.clock import Clock
+
+from conftest import is_rippling
+
+
+async def run_clock(until):
+    while not until():
+        Clock.tick()
+        await asyncio.sleep(0)
+
+
+def run(coroutine):
+    async def main():
+        task = asyncio.ensure_future(coroutine)
+        await run_clock(task.done)
+        return task.result()
+
+    # A dismissal that never resolves fails instead of hanging.
+    return asyncio.run(asyncio.wait_for(main(), 10))
+
+
+def test_start_resolves_to_the_dismiss_reason(make_view):
+    touched = make_view()
+    stopped = make_view(pos=(300, 300))
+
+    async def flow():
+        dismissal = touched.start()
+        await run_clock(lambda: is_rippling(touched))
+        touched.dispatch("on_target_touch")
+        first = await dismissal
+
+        dismissal = stopped.start()
+        Clock.schedule_once(stopped.stop, 0.1)
+        return first, await dismissal, await dismissal
+
+    assert run(flow()) == ("target", "stop", "stop")
+
+
+def test_cancelling_the_awaiting_task_stops_the_view(make_view):
+    view = make_view()
+    dismissed = []
+    view.bind(on_dismiss=lambda view, reason: dismissed.append(reason))
+
+    async def flow():
+        task = asyncio.ensure_future(view.start())
+        await run_clock(lambda: is_rippling(view))
+        task.cancel()
+        await run_clock(lambda: dismissed)
+        return task.cancelled()
+
+    assert run(flow())
+    assert view._canvas is None
+
+
+def test_a_view_restarted_from_its_end_resolves_each_dismissal(make_view):
+    view = make_view()
+    dismissals = []
+
+    def restart(view):
+        if len(dismissals) < 2:
+            dismissals.append(view.start())
+
+    view.end = restart
+
+    async def flow():
+        dismissals.append(view.start())
+        await run_clock(lambda: is_rippling(view))
+        view.dispatch("on_target_touch")
+        first = await dismissals[0]
+
+        await run_clock(lambda: len(dismissals) == 2 and is_rippling(view))
+        view.stop()
+        return first, await dismissals[1]
+
+    assert run(flow()) == ("target", "stop")
@@ -0,0 +1,219 @@
+"""
+Golden frames of every ``widget_position`` and ``title_position``
+combination.
+
+All the combinations are started at once, driven to fixed animation times
+and rendered side by side, each in its own tile, into one offscreen ``Fbo``
+per time. The result must match the images stored in ``golden/``: a tile
+fails once more than ``TTV_GOLDEN_TOLERANCE`` (a ratio of its pixels,
+defaults to `0.002`) of its pixels are off by more than a few levels. A
+title moved by 2% of the outer circle fails it.
+Goldens are rendered headless with Mesa's llvmpipe, other drivers may need
+a higher tolerance.
+Run with ``TTV_GOLDEN_UPDATE=1`` to store the current frames as goldens.
+"""
+
+import os
+
+import pytest
+from kivy.core.image import Image as CoreImage
+from kivy.core.window import Window
+from kivy.graphics import ClearBuffers, ClearColor, Color, Fbo, Rectangle, Scale
+from kivy.uix.widget import Widget
+
+from conftest import tick_until
+
+from taptargetview.governor import governor
+from taptargetview.taptargetview import TapTargetView, _get_overlay_layer
+from taptargetview.timeline import EXPAND_DURATION
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), "golden")
+TOLERANCE = float(os.environ.get("TTV_GOLDEN_TOLERANCE", 0.002))
+UPDATE = os.environ.get("TTV_GOLDEN_UPDATE") == "1"
+
+WINDOW_SIZE = (800, 600)
+TILE_SCALE = 0.25
+TILE_WIDTH, TILE_HEIGHT = (int(side * TILE_SCALE) for side in WINDOW_SIZE)
+# Channel difference above which a pixel is off.
+PIXEL_THRESHOLD = 24
+
+WIDGET_POSITIONS = TapTargetView.widget_position.options
+TITLE_POSITIONS = TapTargetView.title_position.options
+
+# Where the widget sits for each widget position, so that its outer circle
+# mostly stays in the window.
+WIDGET_POS = {
+    "left": (40, 276),
+    "right": (712, 276),
+    "top": (376, 532),
+    "bottom": (376, 20),
+    "left_top": (40, 532),
+    "right_top": (712, 532),
+    "left_bottom": (40, 20),
+    "right_bottom": (712, 20),
+    "center": (376, 276),
+}
+
+
+def render_atlas(views):
+    """
+    Renders the canvas of each view in its own tile of a single Fbo, a row
+    per widget position and a column per title position, the first row at
+    the top.
+
+    :returns: The texture of the Fbo and its pixels, rows from the bottom.
+    """
+
+    columns = len(TITLE_POSITIONS)
+    rows = len(views) // columns
+    atlas = Fbo(size=(columns * TILE_WIDTH, rows * TILE_HEIGHT))
+    with atlas:
+        ClearColor(0, 0, 0, 1)
+        ClearBuffers()
+
+    overlay = _get_overlay_layer()
+    tiles = []
+    for index, view in enumerate(views):
+        # A tile of its own clips the view to its window.
+        tile = Fbo(size=(TILE_WIDTH, TILE_HEIGHT))
+        with tile:
+            # Grey, for the shadow to show.
+            ClearColor(0.5, 0.5, 0.5, 1)
+            ClearBuffers()
+            Scale(TILE_SCALE, TILE_SCALE, 1)
+        overlay.remove(view._canvas)
+        tile.add(view._canvas)
+        tiles.append(tile)
+
+        row, column = divmod(index, columns)
+        atlas.add(tile)
+        with atlas:
+            Color(1, 1, 1, 1)
+            Rectangle(
+                texture=tile.texture,
+                pos=(column * TILE_WIDTH, (rows - 1 - row) * TILE_HEIGHT),
+                size=(TILE_WIDTH, TILE_HEIGHT),
+            )
+    atlas.draw()
+    pixels = atlas.pixels
+
+    for tile, view in zip(tiles, views):
+        tile.remove(view._canvas)
+        overlay.add(view._canvas)
+    return atlas.texture, pixels
+
+
+def load_golden(path):
+    """:returns: The pixels of the image at `path`, rows from the bottom."""
+
+    texture = CoreImage(path).texture
+    stride = texture.width * 4
+    pixels = texture.pixels
+    # Images are stored top row first, loaded textures keep that order.
+    return b"".join(
+        pixels[start : start + stride]
+        for start in range(len(pixels) - stride, -1, -stride)
+    )
+
+
+def off_tiles(pixels, golden, columns, rows):
+    """
+    :returns: The `(row, column, off pixel count)` of the tiles of two
+        atlases with more off pixels than the tolerance allows.
+    """
+
+    stride = columns * TILE_WIDTH * 4
+    limit = TILE_WIDTH * TILE_HEIGHT * TOLERANCE
+    failures = []
+    for row in range(rows):
+        for column in range(columns):
+            off = 0
+            for y in range((rows - 1 - row) * TILE_HEIGHT, (rows - row) * TILE_HEIGHT):
+                start = y * stride + column * TILE_WIDTH * 4
+                end = start + TILE_WIDTH * 4
+                if pixels[start:end] == golden[start:end]:
+                    continue
+                off += sum(
+                    max(
+                        abs(pixels[i] - golden[i]),
+                        abs(pixels[i + 1] - golden[i + 1]),
+                        abs(pixels[i + 2] - golden[i + 2]),
+                    )
+                    > PIXEL_THRESHOLD
+                    for i in range(start, end, 4)
+                )
+            if off > limit:
+                failures.append((row, column, off))
+    return failures
+
+
+@pytest.fixture(scope="module")
+def frames():
+    """
+    Starts every combination and renders them at each frame time.
+
+    :returns: A dict of `(texture, pixels)` by frame name.
+    """
+
+    if tuple(Window.size) != WINDOW_SIZE:
+        pytest.skip(f"golden frames are rendered in a {WINDOW_SIZE} window")
+    assert governor.level == 0
+
+    views = [
+        TapTargetView(
+            widget=Widget(pos=WIDGET_POS[widget_position], size=(48, 48)),
+            widget_position=widget_position,
+            title_position=title_position,
+            title_text="Title",
+            description_text="Description of the target",
+            draw_shadow=True,
+        )
+        for widget_position in WIDGET_POSITIONS
+        for title_position in TITLE_POSITIONS
+    ]
+    # The clock must not tick once the views are started, the frames being
+    # driven by hand.
+    for view in views:
+        view.prepare()
+    tick_until(lambda: all(view._shadow for view in views))
+    for view in views:
+        view.start()
+
+    rendered = {}
+    # Halfway through the expand, then halfway through the first ripple.
+    for view in views:
+        view._update_timeline(EXPAND_DURATION / 2)
+    rendered["expand"] = render_atlas(views)
+    for view in views:
+        view._update_timeline(EXPAND_DURATION)
+        view._update_timeline(view.ripple_duration / 2)
+    rendered["ripple"] = render_atlas(views)
+
+    yield rendered
+    for view in views:
+        view.stop()
+        view._update_timeline(view._timeline.duration)
+
+
+@pytest.mark.parametrize("name", ["expand", "ripple"])
+def test_frames_match_goldens(frames, name, tmp_path):
+    texture, pixels = frames[name]
+    path = os.path.join(GOLDEN_DIR, f"{name}.png")
+    if UPDATE:
+        os.makedirs(GOLDEN_DIR, exist_ok=True)
+        texture.save(path, flipped=True)
+        return
+
+    golden = load_golden(path)
+    assert len(golden) == len(pixels)
+    failures = off_tiles(pixels, golden, len(TITLE_POSITIONS), len(WIDGET_POSITIONS))
+    if failures:
+        actual = tmp_path / f"{name}.png"
+        texture.save(str(actual), flipped=True)
+        combinations = ", ".join(
+            f"{WIDGET_POSITIONS[row]}/{TITLE_POSITIONS[column]} ({off} px)"
+            for row, column, off in failures
+        )
+        pytest.fail(
+            f"{name} frame differs from {path} for {combinations}, see {actual}"
+        )
@@ -0,0 +1,76 @@
+import pytest
+
+from conftest import is_rippling, tick_until
+from taptargetview import governor as governor_module
+from taptargetview.cache import get_circle_mesh
+from taptargetview.governor import QUALITY_LEVELS, governor
+
+
+@pytest.fixture
+def enabled_governor(monkeypatch):
+    logged = []
+    monkeypatch.setattr(governor_module.Logger, "info", logged.append)
+    governor.enabled = True
+    yield logged
+    governor.enabled = False
+    governor.level = 0
+
+
+def feed(frame_time, frames):
+    for _ in range(frames):
+        governor._sample(frame_time)
+
+
+def test_quality_steps_down_on_missed_budgets(make_view, enabled_governor):
+    view = make_view(draw_shadow=True)
+    view.start()
+    tick_until(lambda: is_rippling(view) and view._shadow)
+    tick_until(lambda: view._shadow_rect.size[0])
+    assert view._timeline_event is not None
+
+    feed(1 / 30, 30)
+    assert governor.level == 1
+    assert enabled_governor and "Quality level 1" in enabled_governor[-1]
+    index = view._static_canvas.indexof(view._outer_circle[1]) + 1
+    assert view._static_canvas.children[index] is get_circle_mesh(64)
+
+    feed(1 / 30, 30)
+    assert governor.level == 2
+    assert view._timeline_event is not None
+
+    feed(1 / 30, 60)
+    assert governor.level == 4
+    assert view._timeline_event is None
+    assert view._ripple_alpha == 0
+    tick_until(lambda: view._shadow_rect.size[0] == 0)
+
+    feed(1 / 30, 100)
+    assert governor.level == len(QUALITY_LEVELS) - 1
+
+
+def test_quality_steps_back_up_with_headroom(make_view, enabled_governor):
+    view = make_view()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    governor.level = 3
+    assert view._timeline_event is None
+
+    feed(1 / 60, 119)
+    assert governor.level == 3
+    feed(1 / 60, 1)
+    assert governor.level == 2
+    assert view._timeline_event is not None
+
+    # A level still missing the budget is left again.
+    feed(1 / 40, 30)
+    assert governor.level == 3
+
+
+def test_frame_times_are_only_measured_while_a_view_shows(make_view, enabled_governor):
+    assert governor._event is None
+    view = make_view()
+    view.start()
+    assert governor._event is not None
+    view.stop()
+    tick_until(lambda: view._canvas is None)
+    assert governor._event is None
@@ -0,0 +1,189 @@
+from kivy.core.window import Window
+from kivy.graphics import Color, Rectangle
+from kivy.graphics.opengl import (
+    GL_RGBA,
+    GL_UNSIGNED_BYTE,
+    glFinish,
+    glReadPixels,
+)
+from kivy.metrics import dp
+from kivy.uix.relativelayout import RelativeLayout
+from kivy.uix.widget import Widget
+
+from conftest import is_rippling, tick_for, tick_until
+from taptargetview.governor import governor
+from taptargetview.taptargetview import _STATIC_LAYER_SCALE
+
+
+def count_full_draws(view):
+    draws = []
+    draw_canvas = view._draw_canvas
+
+    def counting_draw_canvas():
+        draws.append(1)
+        draw_canvas()
+
+    view._draw_canvas = counting_draw_canvas
+    return draws
+
+
+def test_static_ripple_frames_only_draw_the_ripple(make_view):
+    view = make_view()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    tick_for(0.05)
+    draws = count_full_draws(view)
+    tick_for(0.1)
+    assert not draws
+
+    view.outer_circle_color = (0, 0, 1)
+    tick_until(lambda: draws)
+    assert view._outer_circle_color.rgb == [0, 0, 1]
+
+
+def test_widget_moves_are_followed(make_view):
+    view = make_view(pos=(100, 100))
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    draws = count_full_draws(view)
+
+    view.widget.pos = (200, 150)
+    tick_until(lambda: draws)
+    assert view._widget_translate.xy == (0, 0)
+    assert view._layout[0] == (224, 174)
+    tick_for(0.05)
+    assert len(draws) == 1
+
+
+def test_parent_moves_are_followed(make_view):
+    view = make_view(pos=(50, 50))
+    view.widget.size_hint = (None, None)
+    parent = RelativeLayout()
+    parent.add_widget(view.widget)
+    Window.add_widget(parent)
+    try:
+        view.start()
+        tick_until(lambda: is_rippling(view))
+        draws = count_full_draws(view)
+
+        # The widget keeps its pos, only its window position changes.
+        parent.pos = (100, 100)
+        Window.dispatch("on_draw")
+        tick_until(lambda: draws)
+        assert view._layout[0] == (174, 174)
+        assert view._hit_circles()[0][:2] == (174, 174)
+    finally:
+        Window.remove_widget(parent)
+
+
+def test_window_resizes_relayout(make_view):
+    view = make_view()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    draws = count_full_draws(view)
+    size = Window.size
+    try:
+        Window.size = (size[0] + 40, size[1])
+        tick_until(lambda: draws)
+    finally:
+        Window.size = size
+
+
+def render():
+    Window.dispatch("on_draw")
+    glFinish()
+    return glReadPixels(0, 0, *Window.size, GL_RGBA, GL_UNSIGNED_BYTE)
+
+
+def test_static_layer_is_cached_during_the_ripple(make_view):
+    view = make_view(pos=(300, 250), outer_circle_alpha=0.7, draw_shadow=True)
+    view.start()
+    tick_until(lambda: is_rippling(view) and view._shadow)
+    tick_for(0.05)
+    layer = view._static_layer
+    assert layer is not None
+
+    cached = render()
+    view._uncache_static_layer()
+    direct = render()
+    view._cache_static_layer()
+    # Only edge pixels may differ, the Window being multisampled.
+    x, y, width, height = view._get_static_layer_bounds()
+    differing = sum(abs(cached[i] - direct[i]) > 2 for i in range(0, len(cached), 4))
+    assert differing < width * height / 100
+
+    # Same area: the Fbo renders the new color by itself.
+    layer = view._static_layer
+    view.outer_circle_color = (0, 0, 1)
+    tick_for(0.05)
+    assert view._static_layer is layer
+    center_x, center_y = view._outer_circle[0].xy
+    i = (int(center_y) * Window.width + int(center_x) + 100) * 4
+    red, green, blue = render()[i : i + 3]
+    assert blue > red and blue > green
+
+    view.widget.pos = (320, 250)
+    tick_until(lambda: view._static_layer is not layer)
+    assert view._get_static_layer_bounds()[0] == x + 20
+
+    view.stop()
+    assert view._static_layer is None
+    assert view._static_canvas in view._canvas.children
+
+
+def test_a_cached_view_started_again_can_be_dismissed(make_view):
+    view = make_view()
+    dismissed = []
+    view.bind(on_dismiss=lambda view, reason: dismissed.append(reason))
+    view.start()
+    tick_until(lambda: is_rippling(view) and view._static_layer)
+    layer = view._static_layer
+
+    view.start()
+    assert view._static_layer is layer
+    view.stop()
+    tick_until(lambda: dismissed)
+    assert view._static_layer is None
+
+
+def test_the_widget_is_drawn_live_from_its_canvas(make_view):
+    parent = Widget()
+    widget = Widget(pos=(300, 250), size=(48, 48))
+    with widget.canvas:
+        color = Color(0, 1, 0)
+        Rectangle(pos=widget.pos, size=widget.size)
+    parent.add_widget(widget)
+    children = list(parent.canvas.children)
+
+    view = make_view()
+    view.widget = widget
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    i = (274 * Window.width + 324) * 4
+    assert render()[i : i + 3] == bytes((0, 255, 0))
+
+    # A press feedback, or any change, shows while the view is up.
+    color.rgb = (0, 0, 1)
+    assert render()[i : i + 3] == bytes((0, 0, 255))
+    assert parent.canvas.children == children
+
+
+def test_only_small_static_layers_are_supersampled(make_view):
+    small = make_view(pos=(300, 250), outer_radius=dp(100))
+    large = make_view(pos=(200, 250))
+    small.start()
+    large.start()
+    tick_until(lambda: small._static_layer and large._static_layer)
+
+    def scale(view):
+        fbo, rect = view._static_layer.children[0], view._static_layer.children[-2]
+        return fbo.size[0] / rect.size[0]
+
+    assert scale(small) == _STATIC_LAYER_SCALE
+    assert scale(large) == 1
+    governor.level = 1
+    try:
+        tick_until(lambda: small._static_layer and scale(small) == 1)
+    finally:
+        governor.level = 0
+    tick_until(lambda: small._static_layer and scale(small) == _STATIC_LAYER_SCALE)
@@ -0,0 +1,70 @@
+from time import time
+from types import SimpleNamespace
+
+from kivy.core.window import Window
+
+from conftest import is_rippling, tick_for, tick_until
+from taptargetview.manager import TapTargetManager
+
+
+def touch_down(x, y):
+    Window.dispatch("on_touch_down", SimpleNamespace(pos=(x, y), time_start=time()))
+
+
+def test_touches_are_routed_to_the_topmost_circle(make_view):
+    lower = make_view(pos=(100, 100), stop_on_outer_touch=True)
+    upper = make_view(pos=(300, 100), cancelable=True)
+    touched = []
+    for view in (lower, upper):
+        for event in ("on_target_touch", "on_outer_touch", "on_outside_click"):
+            view.bind(
+                **{event: lambda view, event=event: touched.append((view, event))}
+            )
+    ended = []
+    manager = TapTargetManager(views=[lower, upper], end=ended.append)
+    manager.start()
+    tick_until(lambda: is_rippling(lower) and is_rippling(upper))
+
+    # Both views ripple on the single tick of the manager.
+    assert len(manager._events) == 2
+
+    touch_down(upper.widget.center_x, upper.widget.center_y)
+    assert touched == [(upper, "on_target_touch")]
+
+    touched.clear()
+    touch_down(lower.widget.center_x, lower.widget.center_y)
+    assert touched == [(lower, "on_target_touch")]
+
+    tick_until(lambda: ended)
+    assert manager._tick_event is None
+    assert lower._manager is upper._manager is None
+
+
+def test_outside_click_only_reaches_cancelable_views(make_view):
+    views = [make_view(pos=(100, 100)), make_view(pos=(120, 100), cancelable=True)]
+    clicked = []
+    for view in views:
+        view.bind(on_outside_click=clicked.append)
+    manager = TapTargetManager(views=views)
+    manager.start()
+    tick_for(0.05)
+
+    touch_down(-5000, -5000)
+    assert clicked == [views[1]]
+    manager.stop()
+
+
+def test_covered_cells_stop_at_the_covering_circle(make_view):
+    lower = make_view(pos=(100, 100))
+    upper = make_view(pos=(110, 100), cancelable=True)
+    manager = TapTargetManager(views=[lower, upper])
+    manager.start()
+    tick_for(0.05)
+
+    grid, cancelable, count, size = manager._build_index()
+    x, y = upper.widget.center
+    entries = grid[int(x // size), int(y // size)]
+    assert [(entry[3], entry[4]) for entry in entries] == [(None, upper)]
+    # The circles reach below the window, whose cells only are indexed.
+    assert all(i >= 0 and j >= 0 for i, j in grid)
+    manager.stop()
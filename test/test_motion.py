@@ -0,0 +1,79 @@
+from kivy.core.window import Window
+
+from conftest import is_rippling, tick_for, tick_until
+from taptargetview.manager import TapTargetManager
+from taptargetview.style import TapTargetStyle
+
+
+def test_ripple_fps_caps_ripple_frames(make_view):
+    capped = make_view(ripple_fps=10)
+    managed = make_view(pos=(300, 300), ripple_fps=10)
+    free = make_view(pos=(500, 100))
+    TapTargetManager(views=[managed]).start()
+    capped.start()
+    free.start()
+    tick_until(lambda: all(map(is_rippling, (capped, managed, free))))
+
+    before = [view.frames_requested for view in (capped, managed, free)]
+    tick_for(0.5)
+    frames = [
+        view.frames_requested - count
+        for view, count in zip((capped, managed, free), before)
+    ]
+    assert frames[0] <= 6 and frames[1] <= 6
+    assert frames[2] > 20
+
+
+def test_ripple_pauses_while_the_window_is_inactive(make_view):
+    view = make_view()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+
+    Window.dispatch("on_minimize")
+    try:
+        frames = view.frames_requested
+        tick_for(0.1)
+        assert view.frames_requested == frames
+    finally:
+        Window.dispatch("on_restore")
+    tick_until(lambda: view.frames_requested > frames)
+
+    Window._focus = False
+    try:
+        frames = view.frames_requested
+        tick_for(0.1)
+        assert view.frames_requested == frames
+        view.pause_when_inactive = False
+        tick_until(lambda: view.frames_requested > frames)
+    finally:
+        Window._focus = True
+
+
+def test_reduced_motion_draws_a_still_halo(make_view):
+    view = make_view(style=TapTargetStyle(reduced_motion=True))
+    dismissed = []
+    view.bind(on_dismiss=lambda view, reason: dismissed.append(reason))
+    view.start()
+    assert tick_until(lambda: is_rippling(view)) <= 2
+    assert view._outer_size == view.outer_radius
+    assert view._target_ripple_color.a > 0
+
+    frames = view.frames_requested
+    tick_for(0.1)
+    assert view.frames_requested == frames
+    assert view._timeline_event is None
+
+    # Changes are still drawn, once.
+    view.widget.pos = (150, 100)
+    tick_until(lambda: view.frames_requested > frames)
+    tick_for(0.05)
+    assert view.frames_requested == frames + 1
+    assert view._layout[0] == (174, 124)
+
+    view.reduced_motion = False
+    tick_for(0.1)
+    assert view.frames_requested > frames + 5
+
+    view.reduced_motion = True
+    view.stop()
+    assert tick_until(lambda: dismissed) <= 2
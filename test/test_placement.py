@@ -0,0 +1,52 @@
+import pytest
+from kivy.core.window import Window
+
+from conftest import is_rippling, tick_for, tick_until
+from taptargetview.placement import placement_cache, solve_title_offset
+from taptargetview.taptargetview import _WIDGET_POSITION_OFFSETS
+
+
+def text_block(view):
+    """Window rectangle of the fully expanded title and description."""
+
+    view._outer_size = view.outer_radius
+    _, (x, y) = view._ttv_pos()
+    title, description = view._title_texture, view._description_texture
+    bottom = y - description.height - 5
+    return x, bottom, x + max(title.width, description.width), y + title.height
+
+
+def test_auto_title_keeps_fitting_presets_and_moves_others(make_view):
+    fitting = make_view(pos=(400, 300))
+    fitting.prepare()
+    preset = _WIDGET_POSITION_OFFSETS["left"][1]
+    assert fitting._layout[2] == pytest.approx((preset[0] - 0.5, preset[1] - 0.5))
+
+    edge = make_view(pos=(Window.width - 150, 300))
+    edge.prepare()
+    left, bottom, right, top = text_block(edge)
+    assert right <= Window.width + 50
+    assert edge._layout[2] != fitting._layout[2]
+
+
+def test_auto_title_with_centered_widget(make_view):
+    view = make_view(widget_position="center")
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    left, bottom, right, top = text_block(view)
+    cx, cy = view.widget.center
+    assert not (left < cx < right and bottom < cy < top)
+
+
+def test_title_placement_is_memoized(make_view):
+    view = make_view()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    misses = placement_cache.misses
+    tick_for(0.1)
+    view._invalidate_layout()
+    view._compute_layout()
+    assert placement_cache.misses == misses
+
+    empty = solve_title_offset((0, 0), (0, 0), 0, 0, (0, 0), (0, 0), (1, 1))
+    assert empty == (0.5, 0.5)
@@ -0,0 +1,46 @@
+from conftest import is_rippling, tick_until
+from taptargetview.cache import text_texture_cache
+
+
+def test_nothing_is_rendered_before_prepare(make_view):
+    misses = text_texture_cache.misses
+    view = make_view(title_text="Lazy title", description_text="Lazy description")
+    view.title_text = "Lazier title"
+    assert view._title_texture is None
+    assert view._description_texture is None
+    assert text_texture_cache.misses == misses
+
+    view.prepare()
+    assert view._title_texture is not None
+    assert view._description_texture is not None
+    assert "Lazy title" not in [key[0] for key in text_texture_cache._entries]
+
+
+def test_text_changes_while_shown_are_rendered(make_view):
+    view = make_view()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    previous = view._title_texture
+    view.title_text = "Another title"
+    assert view._title_texture is previous
+    tick_until(lambda: view._title_texture is not previous)
+
+
+def test_texts_are_drawn_from_one_shared_texture(make_view):
+    first = make_view()
+    second = make_view(pos=(300, 300))
+    first.start()
+    second.start()
+    tick_until(lambda: is_rippling(first) and is_rippling(second))
+
+    block = first._text_rect.texture
+    assert second._text_rect.texture is block
+    title, description = first._title_texture, first._description_texture
+    assert block.size == (
+        max(title.width, description.width),
+        title.height + 5 + description.height,
+    )
+
+    first.title_text_color = (1, 0, 0, 1)
+    tick_until(lambda: first._text_rect.texture is not block)
+    assert second._text_rect.texture is block
@@ -0,0 +1,53 @@
+from conftest import is_rippling, tick_until
+from taptargetview.sequence import TapTargetSequence
+
+
+def test_steps_are_shown_in_order(make_view):
+    steps = [make_view(pos=(100 + i * 200, 100)) for i in range(3)]
+    ended = []
+    sequence = TapTargetSequence(steps=steps, end=ended.append)
+    sequence.start()
+
+    for index, view in enumerate(steps):
+        tick_until(lambda: is_rippling(view))
+        assert sequence.index == index
+        assert all(later._canvas is None for later in steps[index + 1 :])
+        assert not ended
+        view.dispatch("on_target_touch")
+    tick_until(lambda: ended)
+
+    assert ended == [sequence] and sequence.index == -1
+    assert all(view._canvas is None for view in steps)
+
+
+def test_next_step_is_prefetched_and_starts_in_the_same_frame(make_view):
+    first, second = make_view(), make_view(pos=(300, 300))
+    started = []
+    first.end = lambda view: started.append(second._canvas is not None)
+    sequence = TapTargetSequence(steps=[first, second])
+    sequence.start()
+
+    tick_until(lambda: second._prepared)
+    texture = second._title_texture
+    assert texture is not None and second._canvas is None
+    tick_until(lambda: is_rippling(first))
+    first.stop()
+    tick_until(lambda: started)
+
+    assert started == [True]
+    assert second._title_texture is texture
+
+
+def test_stop_unprepares_the_prefetched_step(make_view):
+    first, second = make_view(), make_view(pos=(300, 300))
+    ended = []
+    sequence = TapTargetSequence(steps=[first, second], end=ended.append)
+    sequence.start()
+    tick_until(lambda: second._prepared)
+
+    sequence.stop()
+    assert ended == [sequence]
+    assert not second._prepared and second._title_texture is None
+    assert not second.widget.get_property_observers("pos")
+    tick_until(lambda: first._canvas is None)
+    assert second._canvas is None
@@ -0,0 +1,49 @@
+from conftest import is_rippling, tick_until
+from taptargetview.cache import shadow_texture_cache
+from taptargetview.style import TapTargetStyle
+
+
+def test_shadow_texture_is_shared_per_radius_bucket(make_view):
+    first = make_view(draw_shadow=True, outer_radius=333)
+    second = make_view(pos=(300, 300), draw_shadow=True, outer_radius=334)
+    first.start()
+    second.start()
+    tick_until(lambda: first._shadow and second._shadow)
+
+    assert first._shadow is second._shadow
+    assert first._shadow_rect.texture is first._shadow[0]
+    # The texture may arrive after the first ripple frame; it is drawn with
+    # the next one.
+    tick_until(lambda: is_rippling(first) and first._shadow_rect.size[0])
+    assert first._shadow_rect.size[0] > first._outer_size
+    assert len(shadow_texture_cache) >= 1
+
+
+def test_no_shadow_instructions_by_default(make_view):
+    view = make_view()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    assert view._shadow_rect is None
+
+
+def test_shadow_follows_draw_shadow_after_prepare(make_view):
+    view = make_view()
+    view.prepare()
+    view.draw_shadow = True
+    view.start()
+    tick_until(lambda: view._shadow and view._shadow_rect.texture is view._shadow[0])
+    assert view._shadow_color.a > 0
+
+    view.draw_shadow = False
+    assert view._shadow_rect is None
+    assert view._shadow_color is None
+
+
+def test_shadow_follows_style_after_start(make_view):
+    view = make_view()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    view.style = TapTargetStyle(draw_shadow=True)
+    tick_until(lambda: view._shadow_rect is not None and view._shadow_rect.size[0])
+    assert view._shadow_rect in view._static_canvas.before.children
+    assert view._shadow_color.a > 0
@@ -0,0 +1,75 @@
+from time import time
+from types import SimpleNamespace
+
+from conftest import is_rippling, tick_for, tick_until
+
+
+def test_frame_stats_are_collected(make_view):
+    view = make_view(collect_stats=True)
+    dispatched = []
+    view.bind(on_frame_stats=lambda view, stats: dispatched.append(stats))
+
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    tick_for(0.1)
+    view.dispatch("on_target_touch")
+    tick_until(lambda: not view._prepared)
+
+    stats = view.get_frame_stats()
+    for phase in ("expand", "ripple", "stop", "text"):
+        assert stats[phase]["count"] > 0
+    assert stats["frames"] == sum(
+        stats[phase]["count"] for phase in ("expand", "ripple", "stop")
+    )
+    assert stats["instructions"] > 0
+    assert len(dispatched) >= 2
+    assert dispatched[-1] == stats
+
+
+def test_frame_stats_are_opt_in(make_view):
+    view = make_view()
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    assert view.get_frame_stats() == {}
+
+
+def test_text_changes_within_a_frame_render_once(make_view):
+    view = make_view(collect_stats=True)
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    renders = view.get_frame_stats()["text"]["count"]
+
+    view.title_text = "New title"
+    view.title_text_size = 30
+    view.title_text_bold = False
+    view.description_text = "New description"
+    view.description_text_size = 15
+    assert view.get_frame_stats()["text"]["count"] == renders
+    tick_for(0.05)
+    # Both texts, then the texture combining them.
+    assert view.get_frame_stats()["text"]["count"] == renders + 3
+    assert view._text_rect.texture is view._text_block.texture
+
+
+def test_frame_stats_can_be_reset_between_snapshots(make_view):
+    view = make_view(collect_stats=True)
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    instructions = view.get_frame_stats()["instructions"]
+
+    view.reset_frame_stats()
+    assert view.get_frame_stats() == {"frames": 0, "instructions": instructions}
+    tick_for(0.05)
+    stats = view.get_frame_stats()
+    assert "expand" not in stats and stats["frames"] == stats["ripple"]["count"] > 0
+
+
+def test_touch_latency_runs_from_the_input_event(make_view):
+    view = make_view(collect_stats=True)
+    view.start()
+    tick_until(lambda: is_rippling(view))
+
+    # A touch the input provider stamped 50 ms ago, far from the view.
+    touch = SimpleNamespace(pos=(-5000, -5000), time_start=time() - 0.05)
+    view._some_func(view.widget, touch)
+    assert view.get_frame_stats()["touch"]["max_ms"] >= 50
@@ -0,0 +1,50 @@
+import pytest
+
+from conftest import tick_until
+from taptargetview.style import DEFAULT_STYLE, TapTargetStyle
+
+
+def test_views_read_their_shared_style_unless_overridden(make_view):
+    style = TapTargetStyle(outer_circle_color=[0, 0, 1], title_text_size=30)
+    first = make_view(style=style)
+    second = make_view(style=style, outer_circle_color=(0, 1, 0))
+
+    assert first.outer_circle_color == (0, 0, 1)
+    assert second.outer_circle_color == (0, 1, 0)
+    assert second.title_text_size == 30
+    assert first._style_overrides is None
+    assert make_view().outer_circle_alpha == DEFAULT_STYLE.outer_circle_alpha
+
+
+def test_style_is_immutable():
+    style = TapTargetStyle(draw_shadow=True)
+    with pytest.raises(AttributeError):
+        style.draw_shadow = False
+    with pytest.raises(TypeError):
+        TapTargetStyle(outer_radius=10)
+
+    derived = style.replace(outer_circle_alpha=0.5)
+    assert derived.draw_shadow and derived.outer_circle_alpha == 0.5
+    assert style.outer_circle_alpha == DEFAULT_STYLE.outer_circle_alpha
+
+
+def test_text_style_changes_rerender_prepared_views(make_view):
+    view = make_view()
+    view.prepare()
+    previous = view._title_texture
+    view.style = TapTargetStyle(title_text_size=40)
+    tick_until(lambda: view._title_texture is not previous)
+    previous = view._title_texture
+    view.title_text_bold = False
+    tick_until(lambda: view._title_texture is not previous)
+    assert view.style.title_text_bold
+
+
+def test_binding_a_style_attribute_raises(make_view):
+    view = make_view()
+    with pytest.raises(TypeError, match="style attribute"):
+        view.bind(outer_circle_color=print)
+    with pytest.raises(TypeError, match="style attribute"):
+        view.fbind("draw_shadow", print)
+    view.bind(title_text=print)
+    assert view.fbind("outer_radius", print)
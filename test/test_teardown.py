@@ -0,0 +1,76 @@
+import gc
+import tracemalloc
+
+from kivy.clock import Clock
+
+from conftest import is_rippling, tick_until
+from taptargetview.taptargetview import _INSTRUCTIONS, _get_overlay_layer
+
+
+def cycle(view):
+    """Runs a whole start/stop cycle without waiting for the frames."""
+
+    view.start()
+    view._update_timeline(view._timeline.duration)
+    view._update_timeline(0.5)
+    view.stop()
+    view._update_timeline(view._timeline.duration)
+
+
+def test_teardown_releases_everything(make_view):
+    view = make_view()
+    attributes = set(vars(view.widget))
+    cycle(view)
+
+    assert view._canvas is None and view._timeline_event is None
+    assert set(vars(view.widget)) == attributes
+    assert all(getattr(view, name) is None for name in _INSTRUCTIONS)
+    assert view._timeline is None and view._title_texture is None
+    assert not view.widget.get_property_observers("pos")
+
+    cycle(view)
+    assert view._text_color is None
+    assert view.title_text_color == (1, 1, 1, 1)
+
+
+def test_start_stop_cycles_keep_memory_flat(make_view):
+    view = make_view()
+    for _ in range(100):
+        cycle(view)
+    Clock.tick()
+    gc.collect()
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(2000):
+        cycle(view)
+        if i % 100 == 0:
+            Clock.tick()
+    Clock.tick()
+    gc.collect()
+    growth = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    assert growth < 32 * 1024, f"{growth} bytes retained"
+
+
+def test_starting_a_showing_view_does_nothing(make_view):
+    view = make_view()
+    dismissed = []
+    view.bind(on_dismiss=lambda view, reason: dismissed.append(reason))
+    overlay = _get_overlay_layer()
+    children = len(overlay.children)
+
+    view.start()
+    tick_until(lambda: is_rippling(view))
+    canvas = view._canvas
+    view.start()
+    assert view._canvas is canvas and is_rippling(view)
+    assert len(overlay.children) == children + 1
+
+    view.stop()
+    view.start()
+    assert view._phase == "stop"
+    tick_until(lambda: dismissed)
+    assert len(overlay.children) == children
+    assert view._canvas is None and len(dismissed) == 1
@@ -0,0 +1,35 @@
+import pytest
+from kivy.animation import AnimationTransition
+
+from conftest import is_rippling, tick_until
+from taptargetview.timeline import get_expand_timeline, get_ripple_timeline
+
+
+def test_timelines_follow_their_easing():
+    expand = get_expand_timeline(600, 90)
+    for time in (0, 0.013, 0.1, 0.177):
+        progress = AnimationTransition.out_cubic(time / expand.duration)
+        assert expand.sample(time) == pytest.approx(
+            [600 * progress, 90 * progress], abs=0.5
+        )
+    assert expand.sample(1) == [600, 90]
+
+    ripple = get_ripple_timeline(90, 180, 1)
+    radius, alpha = ripple.sample(0.5)
+    assert radius == pytest.approx(90 + 180 / 8, abs=0.1)
+    assert alpha == pytest.approx(7 / 8, abs=0.01)
+
+
+def test_views_with_the_same_radii_share_timelines(make_view):
+    first = make_view()
+    second = make_view(pos=(300, 300))
+    other = make_view(pos=(500, 100), outer_radius=200)
+    first.start()
+    second.start()
+    other.start()
+    assert first._timeline is second._timeline
+    assert first._timeline is not other._timeline
+
+    tick_until(lambda: is_rippling(first) and is_rippling(second))
+    assert first._timeline is second._timeline
+    assert first._outer_size == first.outer_radius
@@ -0,0 +1,60 @@
+import gc
+import json
+import weakref
+
+import pytest
+from kivy.uix.widget import Widget
+
+from conftest import tick_until
+from taptargetview.style import TapTargetStyle
+from taptargetview.tour import TapTargetTour, iter_tour_steps
+
+
+def write_tour(path, steps):
+    path.write_text(json.dumps(steps, indent=1))
+    return str(path)
+
+
+def test_steps_are_parsed_lazily_across_chunks(tmp_path):
+    steps = [{"widget": "btn", "title_text": f"Step {i} [b]}}[/b]"} for i in range(50)]
+    source = write_tour(tmp_path / "tour.json", steps)
+
+    parsed = iter_tour_steps(source, chunk_size=7)
+    assert next(parsed) == steps[0]
+    assert list(parsed) == steps[1:]
+
+    (tmp_path / "bad.json").write_text('{"widget": "btn"}')
+    with pytest.raises(ValueError):
+        next(iter_tour_steps(str(tmp_path / "bad.json")))
+
+
+def test_finished_steps_are_released(tmp_path):
+    ids = {"a": Widget(pos=(100, 100), size=(48, 48)), "b": Widget(size=(48, 48))}
+    steps = [
+        {"widget": "ab"[i % 2], "title_text": f"Step {i}", "style": "dark"}
+        for i in range(6)
+    ]
+    dark = TapTargetStyle(outer_circle_color=(0.1, 0.1, 0.1))
+    ended = []
+    tour = TapTargetTour(
+        source=write_tour(tmp_path / "tour.json", steps),
+        ids=ids,
+        styles={"dark": dark},
+        end=ended.append,
+    )
+
+    tour.start()
+    finished = []
+    while not ended:
+        view = tour._view
+        assert view.style is dark
+        tick_until(lambda: tour._next_view is not None or tour.index == 5)
+        view.stop()
+        tick_until(lambda: ended or tour._view is not view)
+        finished.append(weakref.ref(view))
+        del view
+        gc.collect()
+        assert all(ref() is None for ref in finished)
+
+    assert len(finished) == 6
+    assert tour.index == -1 and tour._steps is None